@@ -0,0 +1,91 @@
+from checkers.rules import Move, Point
+from checkers.constants import MOVE_OFFSETS
+
+# kinds of moves, by number of cells travelled minus one
+STEP = 0
+JUMP = 1
+
+
+class ActionSpace:
+    """
+    Encodes moves as action indices of a board geometry.
+
+    An action is the kind of move (step or jump), its direction (indexed like
+    MOVE_OFFSETS) and the cell of the moving piece. The index is
+    `((kind * len(MOVE_OFFSETS) + direction) * y_size + y) * x_size + x`, which
+    matches the flattened legal move masks of checkers.batch.
+    """
+
+    def __init__(self, x_size: int, y_size: int):
+        """
+        Initializes the action space of the given board geometry.
+
+        Args:
+            x_size (int): The size of the board along the x-axis.
+            y_size (int): The size of the board along the y-axis.
+        """
+        self.__x_size = x_size
+        self.__y_size = y_size
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of actions.
+
+        Returns:
+            int: The number of move kinds times directions times cells.
+        """
+        return 2 * len(MOVE_OFFSETS) * self.__x_size * self.__y_size
+
+    def encode(self, move: Move) -> int:
+        """Get the action index of a move.
+
+        Args:
+            move (Move): The move to encode.
+
+        Returns:
+            int: The action index of the move.
+        """
+        distance = abs(move.to_x - move.from_x)
+        direction = MOVE_OFFSETS.index(
+            Point(
+                (move.to_x - move.from_x) // distance,
+                (move.to_y - move.from_y) // distance,
+            )
+        )
+        kind = distance - 1
+
+        return (
+            (kind * len(MOVE_OFFSETS) + direction) * self.__y_size + move.from_y
+        ) * self.__x_size + move.from_x
+
+    def decode(self, action: int) -> Move:
+        """Get the move of an action index.
+
+        Args:
+            action (int): The action index to decode.
+
+        Returns:
+            Move: The move of the action.
+        """
+        action, x = divmod(action, self.__x_size)
+        action, y = divmod(action, self.__y_size)
+        kind, direction = divmod(action, len(MOVE_OFFSETS))
+
+        offset = MOVE_OFFSETS[direction]
+        distance = kind + 1
+        return Move(x, y, x + offset.x * distance, y + offset.y * distance)
+
+    def get_legal_mask(self, moves_list: list[Move]) -> list[bool]:
+        """Get the mask of the actions of the given moves.
+
+        Args:
+            moves_list (list[Move]): The legal moves.
+
+        Returns:
+            list[bool]: True for the action of every legal move, False otherwise.
+        """
+        mask = [False] * self.size
+        for move in moves_list:
+            mask[self.encode(move)] = True
+        return mask
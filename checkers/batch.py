@@ -0,0 +1,153 @@
+import numpy as np
+
+from checkers.board import Board
+from checkers.rules import PieceType, SideType
+from checkers.constants import MOVE_OFFSETS
+from typing import Optional, Union
+
+# value used for the cells around the board
+WALL = 0
+
+
+def boards_to_array(boards: list[Board]) -> np.ndarray:
+    """Convert boards of the same size to an array of piece type values.
+
+    Args:
+        boards (list[Board]): The boards to convert.
+
+    Returns:
+        np.ndarray: An N×H×W array holding the PieceType value of every cell.
+    """
+    array = np.empty(
+        (len(boards), boards[0].y_size, boards[0].x_size) if boards else (0, 0, 0),
+        dtype=np.int8,
+    )
+    for n, board in enumerate(boards):
+        for y in range(board.y_size):
+            for x in range(board.x_size):
+                array[n, y, x] = board.type_at(x, y).value
+    return array
+
+
+def sides_to_array(
+    sides: Union[SideType, list[SideType], np.ndarray], n: int
+) -> np.ndarray:
+    """Convert the sides to move to an array of side values.
+
+    Args:
+        sides (Union[SideType, list[SideType], np.ndarray]): One side for all boards,
+            a side per board, or an array of SideType values.
+        n (int): The number of boards.
+
+    Returns:
+        np.ndarray: An array of N SideType values.
+    """
+    if isinstance(sides, SideType):
+        return np.full(n, sides.value, dtype=np.int8)
+    if isinstance(sides, np.ndarray):
+        return sides.astype(np.int8, copy=False)
+    return np.array([side.value for side in sides], dtype=np.int8)
+
+
+def get_jumps_mask(
+    boards: np.ndarray,
+    sides: Union[SideType, list[SideType], np.ndarray],
+    sources: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Get the jumps of many boards at once.
+
+    Args:
+        boards (np.ndarray): An N×H×W array of PieceType values.
+        sides (Union[SideType, list[SideType], np.ndarray]): The side to move on each board.
+        sources (np.ndarray, optional): An N×H×W boolean array of the pieces allowed to jump,
+            e.g. the piece continuing a sequence of jumps. Defaults to all pieces.
+
+    Returns:
+        np.ndarray: An N×4×H×W boolean array, True if the piece on the cell can jump
+            in the direction (indexed like MOVE_OFFSETS).
+    """
+    return _get_masks(boards, sides, sources)[1]
+
+
+def get_moves_mask(
+    boards: np.ndarray, sides: Union[SideType, list[SideType], np.ndarray]
+) -> np.ndarray:
+    """Get the legal moves of many boards at once.
+
+    Like Engine.get_moves_list, a board with a possible jump only gets its jumps.
+
+    Args:
+        boards (np.ndarray): An N×H×W array of PieceType values.
+        sides (Union[SideType, list[SideType], np.ndarray]): The side to move on each board.
+
+    Returns:
+        np.ndarray: An N×2×4×H×W boolean array, True if the piece on the cell can make
+            the kind of move (checkers.actions.STEP or JUMP) in the direction
+            (indexed like MOVE_OFFSETS).
+    """
+    steps_mask, jumps_mask = _get_masks(boards, sides)
+
+    # if a piece can jump, jumping is required
+    has_jumps = jumps_mask.any(axis=(1, 2, 3))
+    steps_mask[has_jumps] = False
+
+    return np.stack((steps_mask, jumps_mask), axis=1)
+
+
+def _get_masks(
+    boards: np.ndarray,
+    sides: Union[SideType, list[SideType], np.ndarray],
+    sources: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get the steps and the jumps of many boards, without the capture rule.
+
+    Args:
+        boards (np.ndarray): An N×H×W array of PieceType values.
+        sides (Union[SideType, list[SideType], np.ndarray]): The side to move on each board.
+        sources (np.ndarray, optional): An N×H×W boolean array of the pieces allowed to move.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The N×4×H×W step and jump masks.
+    """
+    n, y_size, x_size = boards.shape
+    sides = sides_to_array(sides, n)
+    is_white = (sides == SideType.WHITE.value)[:, None, None]
+
+    friendly_value = np.where(
+        is_white, PieceType.WHITE_PIECE.value, PieceType.BLACK_PIECE.value
+    )
+    enemy_value = np.where(
+        is_white, PieceType.BLACK_PIECE.value, PieceType.WHITE_PIECE.value
+    )
+
+    friendly = boards == friendly_value
+    if sources is not None:
+        friendly &= sources
+
+    # surround the boards with walls, so shifted views never leave the array
+    padded = np.pad(boards, ((0, 0), (2, 2), (2, 2)), constant_values=WALL)
+
+    steps_mask = np.zeros((n, len(MOVE_OFFSETS), y_size, x_size), dtype=bool)
+    jumps_mask = np.zeros((n, len(MOVE_OFFSETS), y_size, x_size), dtype=bool)
+
+    for direction, offset in enumerate(MOVE_OFFSETS):
+        # pieces only move forward: up for white, down for black
+        forward = is_white if offset.y < 0 else ~is_white
+
+        neighbor = padded[
+            :, 2 + offset.y : 2 + offset.y + y_size, 2 + offset.x : 2 + offset.x + x_size
+        ]
+        landing = padded[
+            :,
+            2 + offset.y * 2 : 2 + offset.y * 2 + y_size,
+            2 + offset.x * 2 : 2 + offset.x * 2 + x_size,
+        ]
+
+        movable = friendly & forward
+        steps_mask[:, direction] = movable & (neighbor == PieceType.NONE.value)
+        # check if the enemy piece is in front and an empty space is two steps ahead
+        jumps_mask[:, direction] = (
+            movable & (neighbor == enemy_value) & (landing == PieceType.NONE.value)
+        )
+
+    return steps_mask, jumps_mask
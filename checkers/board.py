@@ -1,9 +1,41 @@
+import random
+
 from checkers.rules import Checker, PieceType
 from checkers.constants import WHITE_PIECES, BLACK_PIECES
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(x_size: int, y_size: int) -> dict[PieceType, tuple[int, ...]]:
+    """
+    Get the Zobrist keys of a board geometry.
+
+    The keys are generated once per geometry from a fixed seed, so equal
+    positions always have equal hash keys.
+
+    Args:
+        x_size (int): The size of the board along the x-axis.
+        y_size (int): The size of the board along the y-axis.
+
+    Returns:
+        dict[PieceType, tuple[int, ...]]: A random 64-bit key per piece type and cell index.
+    """
+    generator = random.Random(x_size * 1000 + y_size)
+    return {
+        piece_type: tuple(generator.getrandbits(64) for _ in range(x_size * y_size))
+        for piece_type in (PieceType.WHITE_PIECE, PieceType.BLACK_PIECE)
+    }
 
 
 class Board:
-    """Represents a checkers board"""
+    """
+    Represents a checkers board.
+
+    The board is stored as bitboards: one integer mask per side, where the bit
+    with index `y * x_size + x` is set if the side has a piece on that cell.
+    A Zobrist hash key of the position and the piece counters of both sides
+    are updated along with the masks.
+    """
 
     def __init__(self, x_size: int, y_size: int):
         """
@@ -15,6 +47,8 @@ class Board:
         """
         self.__x_size = x_size
         self.__y_size = y_size
+        self.__full_mask = (1 << (x_size * y_size)) - 1
+        self.__zobrist_keys = get_zobrist_keys(x_size, y_size)
         self.__generate()
 
     @property
@@ -47,6 +81,46 @@ class Board:
         """
         return max(self.x_size, self.y_size)
 
+    @property
+    def white_mask(self) -> int:
+        """
+        Get the bitboard of the white pieces.
+
+        Returns:
+            int: A mask with a bit set for every cell occupied by a white piece.
+        """
+        return self.__white_mask
+
+    @property
+    def black_mask(self) -> int:
+        """
+        Get the bitboard of the black pieces.
+
+        Returns:
+            int: A mask with a bit set for every cell occupied by a black piece.
+        """
+        return self.__black_mask
+
+    @property
+    def empty_mask(self) -> int:
+        """
+        Get the bitboard of the empty cells.
+
+        Returns:
+            int: A mask with a bit set for every empty cell.
+        """
+        return self.__full_mask & ~(self.__white_mask | self.__black_mask)
+
+    @property
+    def hash_key(self) -> int:
+        """
+        Get the Zobrist hash key of the position.
+
+        Returns:
+            int: The XOR of the keys of all pieces on the board.
+        """
+        return self.__hash_key
+
     @classmethod
     def copy(cls, board_instance):
         """
@@ -58,36 +132,63 @@ class Board:
         Returns:
             Board: A new board instance that is a copy of the original board.
         """
-        board_copy = cls(board_instance.x_size, board_instance.y_size)
+        board_copy = cls.__new__(cls)
+        board_copy.__x_size = board_instance.__x_size
+        board_copy.__y_size = board_instance.__y_size
+        board_copy.__full_mask = board_instance.__full_mask
+        board_copy.__white_mask = board_instance.__white_mask
+        board_copy.__black_mask = board_instance.__black_mask
+        board_copy.__zobrist_keys = board_instance.__zobrist_keys
+        board_copy.__hash_key = board_instance.__hash_key
+        board_copy.__white_count = board_instance.__white_count
+        board_copy.__black_count = board_instance.__black_count
+        return board_copy
 
-        for y in range(board_instance.y_size):
-            for x in range(board_instance.x_size):
-                board_copy.at(x, y).change_type(board_instance.type_at(x, y))
+    def __eq__(self, other) -> bool:
+        """
+        Checks if two boards hold the same position.
 
-        return board_copy
+        Boards are mutable and compared by position, so they are not hashable;
+        hash_key is the hash of the position.
 
-    def __generate(self):
+        Args:
+            other (Board): The other board to compare with.
+
+        Returns:
+            bool: True if both boards have the same size and pieces, False otherwise.
         """
-        Generate the checkers board by initializing the checkers array and assigning piece types to each checker.
+        return (
+            isinstance(other, Board)
+            and self.__x_size == other.__x_size
+            and self.__y_size == other.__y_size
+            and self.__white_mask == other.__white_mask
+            and self.__black_mask == other.__black_mask
+        )
 
-        The checkers array is a 2D list representing the checkers board.
-        Each element in the array is an instance of the Checker class.
+    # equal boards must have equal hashes, and the position of a board changes
+    __hash__ = None
+
+    def __generate(self):
+        """
+        Generate the checkers board by filling the bitboards of both sides.
 
         The piece types are assigned based on the position of the checker on the board.
         Checkers in the top two rows are assigned the PieceType.BLACK_PIECE type.
         Checkers in the bottom two rows are assigned the PieceType.WHITE_PIECE type.
         """
-        self.__checkers = [
-            [Checker() for _ in range(self.x_size)] for _ in range(self.y_size)
-        ]
-
-        for y, row in enumerate(self.__checkers):
-            for x, checker in enumerate(row):
+        self.__white_mask = 0
+        self.__black_mask = 0
+        self.__hash_key = 0
+        self.__white_count = 0
+        self.__black_count = 0
+
+        for y in range(self.y_size):
+            for x in range(self.x_size):
                 if (y + x) % 2:
                     if y < 2:
-                        checker.change_type(PieceType.BLACK_PIECE)
+                        self.set_type_at(x, y, PieceType.BLACK_PIECE)
                     elif y >= self.y_size - 2:
-                        checker.change_type(PieceType.WHITE_PIECE)
+                        self.set_type_at(x, y, PieceType.WHITE_PIECE)
 
     def type_at(self, x: int, y: int) -> PieceType:
         """Gets the type of checker on the board at the given coordinates.
@@ -99,11 +200,49 @@ class Board:
         Returns:
             PieceType: The type of checker at the given coordinates.
         """
-        return self.__checkers[y][x].type
+        bit = 1 << (y * self.__x_size + x)
+        if self.__white_mask & bit:
+            return PieceType.WHITE_PIECE
+        if self.__black_mask & bit:
+            return PieceType.BLACK_PIECE
+        return PieceType.NONE
+
+    def set_type_at(self, x: int, y: int, type: PieceType):
+        """Sets the type of checker on the board at the given coordinates.
+
+        Args:
+            x (int): The x-coordinate of the checker.
+            y (int): The y-coordinate of the checker.
+            type (PieceType): The new type of the checker.
+        """
+        index = y * self.__x_size + x
+        bit = 1 << index
+
+        # remove the previous piece
+        if self.__white_mask & bit:
+            self.__white_mask &= ~bit
+            self.__white_count -= 1
+            self.__hash_key ^= self.__zobrist_keys[PieceType.WHITE_PIECE][index]
+        elif self.__black_mask & bit:
+            self.__black_mask &= ~bit
+            self.__black_count -= 1
+            self.__hash_key ^= self.__zobrist_keys[PieceType.BLACK_PIECE][index]
+
+        # place the new piece
+        if type in WHITE_PIECES:
+            self.__white_mask |= bit
+            self.__white_count += 1
+            self.__hash_key ^= self.__zobrist_keys[PieceType.WHITE_PIECE][index]
+        elif type in BLACK_PIECES:
+            self.__black_mask |= bit
+            self.__black_count += 1
+            self.__hash_key ^= self.__zobrist_keys[PieceType.BLACK_PIECE][index]
 
     def at(self, x: int, y: int) -> Checker:
         """Gets the checker on the board at the given coordinates
 
+        The returned checker is bound to the board, so changing its type changes the board.
+
         Args:
             x (int): The x-coordinate of the checker
             y (int): The y-coordinate of the checker
@@ -111,7 +250,7 @@ class Board:
         Returns:
             Checker: The checker at the given coordinates
         """
-        return self.__checkers[y][x]
+        return BoardChecker(self, x, y)
 
     def is_within(self, x: int, y: int) -> bool:
         """
@@ -134,9 +273,7 @@ class Board:
         Returns:
             int: The count of white checkers.
         """
-        return sum(
-            checker.type in WHITE_PIECES for row in self.__checkers for checker in row
-        )
+        return self.__white_count
 
     @property
     def black_checkers_count(self) -> int:
@@ -146,9 +283,7 @@ class Board:
         Returns:
             int: The count of black checkers.
         """
-        return sum(
-            checker.type in BLACK_PIECES for row in self.__checkers for checker in row
-        )
+        return self.__black_count
 
     @property
     def white_score(self) -> int:
@@ -158,11 +293,7 @@ class Board:
         Returns:
             The total number of white pieces on the board.
         """
-        return sum(
-            checker.type == PieceType.WHITE_PIECE
-            for row in self.__checkers
-            for checker in row
-        )
+        return self.__white_count
 
     @property
     def black_score(self) -> int:
@@ -172,8 +303,50 @@ class Board:
         Returns:
             int: The number of black pieces on the board.
         """
-        return sum(
-            checker.type == PieceType.BLACK_PIECE
-            for row in self.__checkers
-            for checker in row
-        )
+        return self.__black_count
+
+
+class BoardChecker(Checker):
+    """
+    Represents a checker placed on a board cell.
+
+    Reading or changing its type reads or changes the underlying board.
+    """
+
+    __slots__ = ("__board", "__x", "__y")
+
+    def __init__(self, board: Board, x: int, y: int):
+        """
+        Initializes a checker bound to the given board cell.
+
+        Args:
+            board (Board): The board the checker is placed on.
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+        """
+        self.__board = board
+        self.__x = x
+        self.__y = y
+
+    @property
+    def type(self) -> PieceType:
+        """
+        Get the type of the checker piece.
+
+        Returns:
+            PieceType: The type of the piece on the bound cell.
+        """
+        return self.__board.type_at(self.__x, self.__y)
+
+    @type.setter
+    def type(self, type: PieceType):
+        self.__board.set_type_at(self.__x, self.__y, type)
+
+    def change_type(self, type: PieceType):
+        """
+        Changes the type of the checker piece.
+
+        Args:
+            type (PieceType): The new type of the checker piece.
+        """
+        self.__board.set_type_at(self.__x, self.__y, type)
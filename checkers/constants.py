@@ -8,11 +8,35 @@ X_SIZE = Y_SIZE = 6
 # size of a cell (in pixels)
 CELL_SIZE = 75
 
-# animation speed (the higher the value, the faster the animation)
-ANIMATION_SPEED = 4
+# time (in seconds) for an animated piece to cross a cell
+ANIMATION_DURATION = 0.15
+# time (in milliseconds) between two frames of an animation
+ANIMATION_FRAME_INTERVAL = 16
+# time (in milliseconds) between two checks for the moves of the AI
+AI_POLL_INTERVAL = 20
 
-# number of moves used for the AI to predict the best move
-MAX_PREDICTION_DEPTH = 1
+# backend choosing the AI moves: "search" (alpha-beta search) or "dqn" (DQN policy)
+AI_BACKEND = "search"
+# True to train the DQN on the moves of both sides; False together with
+# AI_BACKEND = "search" never imports torch, so the game starts faster
+TRAIN_DQN = True
+
+# maximum number of turns the AI looks ahead to predict the best move
+MAX_PREDICTION_DEPTH = 16
+# time budget (in seconds) for the AI to predict the best move
+PREDICTION_TIME_LIMIT = 1.0
+# number of positions remembered by the AI between searches
+TRANSPOSITION_TABLE_SIZE = 2**18
+
+# directory of the images
+ASSETS_PATH = "assets"
+# image file of every piece type, a future type (e.g. king) only needs an entry
+PIECE_SPRITES = {
+    PieceType.WHITE_PIECE: "white-piece.png",
+    PieceType.BLACK_PIECE: "black-piece.png",
+}
+# brightness factor of the highlighted sprites
+HIGHLIGHT_BRIGHTNESS = 1.4
 
 # border width
 BORDER_WIDTH = 2 * 2
@@ -40,3 +64,41 @@ BATCH_SIZE = 64
 GAMMA = 0.99
 EPSILON = 0.1
 REPLAY_BUFFER_SIZE = 10000
+# number of encoded positions kept in memory
+ENCODING_CACHE_SIZE = 4096
+# number of training steps between two updates of the target network
+TARGET_UPDATE_INTERVAL = 100
+# weight of the trained network in a target update (1.0 copies it)
+TARGET_UPDATE_TAU = 1.0
+# prioritized experience replay
+PRIORITY_ALPHA = 0.6
+PRIORITY_BETA = 0.4
+PRIORITY_EPSILON = 1e-5
+# rewards of the self-play environment
+CAPTURE_REWARD = 1.0
+WIN_REWARD = 10.0
+
+# self-play training
+SELF_PLAY_WORKERS = 4
+# number of games played in parallel by each worker
+SELF_PLAY_ENVS = 64
+# maximum number of steps waiting to be read by the learner
+SELF_PLAY_QUEUE_SIZE = 64
+# time (in seconds) the learner waits for transitions before checking the workers are alive
+SELF_PLAY_QUEUE_TIMEOUT = 1.0
+# number of training steps between two publications of the weights
+WEIGHTS_SYNC_INTERVAL = 100
+
+# batched inference
+INFERENCE_MAX_BATCH_SIZE = 256
+# maximum time in seconds a request waits for other ones
+INFERENCE_MAX_WAIT = 0.005
+# number of torch threads of a game process, 0 for the default of torch
+INFERENCE_THREADS = 1
+# play with an int8 copy of the DQN
+QUANTIZE_INFERENCE = False
+
+# checkpoint of the training state, restored on startup
+CHECKPOINT_PATH = "./checkpoints/dqn.pt"
+# TorchScript export of the DQN for inference
+POLICY_PATH = "./checkpoints/dqn-policy.pt"
@@ -0,0 +1,140 @@
+import numpy as np
+
+from checkers.board import Board
+from checkers.batch import sides_to_array
+from checkers.rules import PieceType, SideType
+from checkers.constants import ENCODING_CACHE_SIZE
+from functools import lru_cache
+from typing import Union
+
+# planes of the encoding: own pieces, enemy pieces, side to move, empty cells
+PLANES_COUNT = 4
+
+
+def get_encoding_size(x_size: int, y_size: int) -> int:
+    """Get the size of the encoding of a board geometry.
+
+    Args:
+        x_size (int): The size of the board along the x-axis.
+        y_size (int): The size of the board along the y-axis.
+
+    Returns:
+        int: The number of planes times the number of cells.
+    """
+    return PLANES_COUNT * x_size * y_size
+
+
+def encode_board(board: Board, side: SideType) -> np.ndarray:
+    """Encode a position as flattened planes.
+
+    The planes are the pieces of the side to move, the enemy pieces, a plane
+    filled with 1 if white is to move, and the empty cells. The encoding is
+    cached per position as a read-only float32 array, so encoding it again is
+    free and the model and the replay buffer copy it without any conversion.
+
+    Args:
+        board (Board): The board of the position.
+        side (SideType): The side to move.
+
+    Returns:
+        np.ndarray: The read-only planes, each one holding a value per cell in row-major order.
+    """
+    return _encode_masks(
+        board.x_size * board.y_size,
+        board.white_mask,
+        board.black_mask,
+        side == SideType.WHITE,
+    )
+
+
+def encode_boards(boards: list[Board], sides: list[SideType]) -> np.ndarray:
+    """Encode many positions at once.
+
+    Args:
+        boards (list[Board]): The boards of the positions.
+        sides (list[SideType]): The side to move in each position.
+
+    Returns:
+        np.ndarray: An N×(PLANES_COUNT·H·W) array of the encodings.
+    """
+    return np.stack(
+        [encode_board(board, side) for board, side in zip(boards, sides)]
+    )
+
+
+def encode_arrays(
+    boards: np.ndarray, sides: Union[SideType, list[SideType], np.ndarray]
+) -> np.ndarray:
+    """Encode many positions given as arrays of piece type values at once.
+
+    Args:
+        boards (np.ndarray): An N×H×W array of PieceType values.
+        sides (Union[SideType, list[SideType], np.ndarray]): The side to move in each position.
+
+    Returns:
+        np.ndarray: An N×(PLANES_COUNT·H·W) array of the encodings, like encode_board.
+    """
+    n = len(boards)
+    is_white = (sides_to_array(sides, n) == SideType.WHITE.value)[:, None, None]
+
+    white = boards == PieceType.WHITE_PIECE.value
+    black = boards == PieceType.BLACK_PIECE.value
+
+    planes = np.stack(
+        (
+            np.where(is_white, white, black),
+            np.where(is_white, black, white),
+            np.broadcast_to(is_white, boards.shape),
+            boards == PieceType.NONE.value,
+        ),
+        axis=1,
+    )
+    return planes.reshape(n, -1).astype(np.float32)
+
+
+@lru_cache(maxsize=ENCODING_CACHE_SIZE)
+def _encode_masks(
+    cells_count: int, white_mask: int, black_mask: int, is_white: bool
+) -> np.ndarray:
+    """Encode a position given by its bitboards.
+
+    Args:
+        cells_count (int): The number of cells of the board.
+        white_mask (int): The mask of the white pieces.
+        black_mask (int): The mask of the black pieces.
+        is_white (bool): True if white is to move.
+
+    Returns:
+        np.ndarray: The read-only flattened planes, like encode_board.
+    """
+    own_mask, enemy_mask = (
+        (white_mask, black_mask) if is_white else (black_mask, white_mask)
+    )
+    empty_mask = ((1 << cells_count) - 1) & ~(white_mask | black_mask)
+
+    planes = np.concatenate(
+        (
+            _mask_to_plane(own_mask, cells_count),
+            _mask_to_plane(enemy_mask, cells_count),
+            np.full(cells_count, 1.0 if is_white else 0.0, dtype=np.float32),
+            _mask_to_plane(empty_mask, cells_count),
+        )
+    )
+    # the array is shared by every caller of the cache
+    planes.flags.writeable = False
+    return planes
+
+
+def _mask_to_plane(mask: int, cells_count: int) -> np.ndarray:
+    """Convert a mask to a plane of 0 and 1 values.
+
+    Args:
+        mask (int): The mask to convert.
+        cells_count (int): The number of cells of the board.
+
+    Returns:
+        np.ndarray: The float32 value of each bit, lowest bit first.
+    """
+    mask_bytes = mask.to_bytes((cells_count + 7) // 8, "little")
+    bits = np.unpackbits(np.frombuffer(mask_bytes, dtype=np.uint8), bitorder="little")
+    return bits[:cells_count].astype(np.float32)
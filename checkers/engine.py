@@ -0,0 +1,342 @@
+from checkers.board import Board
+from checkers.rules import Move, MoveRecord, PieceType, SideType, Point
+from checkers.tables import get_move_tables, shift_mask
+from typing import Optional
+
+
+class Engine:
+    """
+    Headless checkers rules engine.
+
+    Works on a Board without any GUI or RL dependencies, so it can be used
+    for self-play, search and serving moves from a backend process.
+    """
+
+    def __init__(self, board: Board, side: SideType = SideType.WHITE):
+        """
+        Initializes a new instance of the Engine class.
+
+        Args:
+            board (Board): The board the engine plays on. It is modified in place.
+            side (SideType, optional): The side to move. Defaults to SideType.WHITE.
+        """
+        self.__board = board
+        self.__side = side
+        self.__tables = get_move_tables(board.x_size, board.y_size)
+
+    @property
+    def board(self) -> Board:
+        """
+        Get the board the engine plays on.
+
+        Returns:
+            Board: The board of the engine.
+        """
+        return self.__board
+
+    @property
+    def side(self) -> SideType:
+        """
+        Get the side to move.
+
+        Returns:
+            SideType: The side to move.
+        """
+        return self.__side
+
+    def get_moves_list(self, side: Optional[SideType] = None) -> list[Move]:
+        """Get the list of moves for the specified side.
+
+        Args:
+            side (SideType, optional): The side for which to get the moves. Defaults to the side to move.
+
+        Returns:
+            list[Move]: The list of moves for the specified side.
+        """
+        moves_list = self.get_required_moves_list(side)
+        if not (moves_list):
+            moves_list = self.get_optional_moves_list(side)
+        return moves_list
+
+    def get_required_moves_list(self, side: Optional[SideType] = None) -> list[Move]:
+        """Get the list of mandatory moves.
+
+        Args:
+            side (SideType, optional): The side for which to get the mandatory moves. Defaults to the side to move.
+
+        Returns:
+            list[Move]: The list of mandatory moves.
+        """
+        side = side or self.__side
+        return self.__get_jumps_list(side, self.__get_friendly_mask(side))
+
+    def get_optional_moves_list(self, side: Optional[SideType] = None) -> list[Move]:
+        """Get the list of optional moves for a given side.
+
+        Args:
+            side (SideType, optional): The side for which to get the optional moves. Defaults to the side to move.
+
+        Returns:
+            list[Move]: The list of optional moves.
+        """
+        side = side or self.__side
+        moves_list = []
+
+        friendly_mask = self.__get_friendly_mask(side)
+        empty_mask = self.__board.empty_mask
+        x_size = self.__board.x_size
+
+        for direction in self.__tables.forward_directions[side]:
+            shift = self.__tables.shifts[direction]
+            # empty cells a friendly piece can step to
+            targets = (
+                shift_mask(friendly_mask & self.__tables.step_sources[direction], shift)
+                & empty_mask
+            )
+
+            while targets:
+                target = targets & -targets
+                targets ^= target
+                to_index = target.bit_length() - 1
+                from_index = to_index - shift
+                moves_list.append(
+                    Move(
+                        from_index % x_size,
+                        from_index // x_size,
+                        to_index % x_size,
+                        to_index // x_size,
+                    )
+                )
+
+        return moves_list
+
+    def get_continuation_moves_list(
+        self, move: Move, side: Optional[SideType] = None
+    ) -> list[Move]:
+        """Get the list of jumps the piece that just made the move can continue with.
+
+        Args:
+            move (Move): The move that was just made.
+            side (SideType, optional): The side that made the move. Defaults to the side to move.
+
+        Returns:
+            list[Move]: The list of mandatory moves starting where the move ended.
+        """
+        side = side or self.__side
+        source_mask = 1 << (move.to_y * self.__board.x_size + move.to_x)
+        return self.__get_jumps_list(side, self.__get_friendly_mask(side) & source_mask)
+
+    def __get_friendly_mask(self, side: SideType) -> int:
+        """Get the mask of the pieces of a side.
+
+        Args:
+            side (SideType): The side of the pieces.
+
+        Returns:
+            int: The mask of the cells occupied by the side.
+        """
+        if side == SideType.WHITE:
+            return self.__board.white_mask
+        if side == SideType.BLACK:
+            return self.__board.black_mask
+        return 0
+
+    def __get_jumps_list(self, side: SideType, sources_mask: int) -> list[Move]:
+        """Get the list of jumps the given pieces of a side can make.
+
+        Args:
+            side (SideType): The side making the jumps.
+            sources_mask (int): The mask of the pieces that may jump.
+
+        Returns:
+            list[Move]: The list of jumps.
+        """
+        moves_list = []
+
+        enemy_mask = self.__get_friendly_mask(SideType.opposite(side))
+        empty_mask = self.__board.empty_mask
+        x_size = self.__board.x_size
+
+        for direction in self.__tables.forward_directions[side]:
+            shift = self.__tables.shifts[direction]
+            # check if the enemy piece is in front and an empty space is two steps ahead
+            jumped = (
+                shift_mask(sources_mask & self.__tables.jump_sources[direction], shift)
+                & enemy_mask
+            )
+            targets = shift_mask(jumped, shift) & empty_mask
+
+            while targets:
+                target = targets & -targets
+                targets ^= target
+                to_index = target.bit_length() - 1
+                from_index = to_index - 2 * shift
+                moves_list.append(
+                    Move(
+                        from_index % x_size,
+                        from_index // x_size,
+                        to_index % x_size,
+                        to_index // x_size,
+                    )
+                )
+
+        return moves_list
+
+    def handle_move(self, move: Move) -> MoveRecord:
+        """Move a piece from one cell to another.
+
+        Args:
+            move (Move): The move object containing the coordinates of the piece to be moved.
+
+        Returns:
+            MoveRecord: The record of the move, which can be passed to undo_move.
+        """
+        piece_type = self.__board.type_at(move.from_x, move.from_y)
+
+        # change the position of the piece
+        self.__board.set_type_at(move.to_x, move.to_y, piece_type)
+        self.__board.set_type_at(move.from_x, move.from_y, PieceType.NONE)
+
+        # movement vectors
+        dx = -1 if move.from_x < move.to_x else 1
+        dy = -1 if move.from_y < move.to_y else 1
+
+        # delete the killed piece
+        captured = []
+        x, y = move.to_x + dx, move.to_y + dy
+        while x != move.from_x or y != move.from_y:
+            captured_type = self.__board.type_at(x, y)
+            if captured_type != PieceType.NONE:
+                self.__board.set_type_at(x, y, PieceType.NONE)
+                captured.append((Point(x, y), captured_type))
+            x += dx
+            y += dy
+
+        return MoveRecord(move, piece_type, captured)
+
+    def undo_move(self, record: MoveRecord):
+        """Take back a move applied with handle_move.
+
+        Moves must be undone in the reverse order they were applied.
+
+        Args:
+            record (MoveRecord): The record returned by handle_move.
+        """
+        move = record.move
+        self.__board.set_type_at(move.to_x, move.to_y, PieceType.NONE)
+        self.__board.set_type_at(move.from_x, move.from_y, record.piece_type)
+
+        for point, captured_type in record.captured:
+            self.__board.set_type_at(point.x, point.y, captured_type)
+
+    def get_turns_list(self, side: Optional[SideType] = None) -> list[list[Move]]:
+        """Get the list of complete turns for the specified side.
+
+        A turn is a single move, or a whole sequence of jumps made by one piece.
+
+        Args:
+            side (SideType, optional): The side for which to get the turns. Defaults to the side to move.
+
+        Returns:
+            list[list[Move]]: The list of turns, each one being the list of its moves.
+        """
+        side = side or self.__side
+        turns_list = []
+        self.__collect_turns(side, self.get_moves_list(side), [], turns_list)
+        return turns_list
+
+    def __collect_turns(
+        self,
+        side: SideType,
+        moves_list: list[Move],
+        current_turn: list[Move],
+        turns_list: list[list[Move]],
+    ):
+        """Recursively expand the moves into complete turns.
+
+        Args:
+            side (SideType): The side making the turn.
+            moves_list (list[Move]): The moves that can be made at this point of the turn.
+            current_turn (list[Move]): The moves already made in this turn.
+            turns_list (list[list[Move]]): The list to store the complete turns.
+        """
+        for move in moves_list:
+            record = self.handle_move(move)
+
+            continuation_moves_list = []
+            if record.has_killed_piece:
+                continuation_moves_list = self.get_continuation_moves_list(move, side)
+
+            # check if the current piece can move again
+            if continuation_moves_list:
+                self.__collect_turns(
+                    side, continuation_moves_list, current_turn + [move], turns_list
+                )
+            else:
+                turns_list.append(current_turn + [move])
+
+            self.undo_move(record)
+
+    def make_turn(self, turn: list[Move]) -> list[MoveRecord]:
+        """Apply all moves of a turn.
+
+        Args:
+            turn (list[Move]): The moves of the turn.
+
+        Returns:
+            list[MoveRecord]: The records of the moves, which can be passed to undo_turn.
+        """
+        return [self.handle_move(move) for move in turn]
+
+    def undo_turn(self, records: list[MoveRecord]):
+        """Take back a turn applied with make_turn.
+
+        Args:
+            records (list[MoveRecord]): The records returned by make_turn.
+        """
+        for record in reversed(records):
+            self.undo_move(record)
+
+    def make_move(self, move: Move) -> bool:
+        """Play a move for the side to move and pass the turn if it is over.
+
+        The turn stays with the same side if the move killed a piece and the
+        same piece can jump again.
+
+        Args:
+            move (Move): The move to play.
+
+        Returns:
+            bool: True if the same side has to continue jumping, False otherwise.
+        """
+        record = self.handle_move(move)
+
+        if record.has_killed_piece and self.get_continuation_moves_list(move):
+            return True
+
+        self.__side = SideType.opposite(self.__side)
+        return False
+
+    def get_winner(self) -> Optional[SideType]:
+        """Get the winner of the game.
+
+        A side loses as soon as it has no valid moves left.
+
+        Returns:
+            Optional[SideType]: The winning side, or None if the game is not over.
+        """
+        if not (self.get_moves_list(SideType.WHITE)):
+            return SideType.BLACK
+
+        if not (self.get_moves_list(SideType.BLACK)):
+            return SideType.WHITE
+
+        return None
+
+    def is_game_over(self) -> bool:
+        """Check if the game is over.
+
+        Returns:
+            bool: True if one of the sides has no valid moves left, False otherwise.
+        """
+        return self.get_winner() is not None
@@ -1,20 +1,24 @@
-import torch
-import torch.optim as optim
-import random
 import logging
+import numpy as np
+import queue
+import threading
+import time
 
 from checkers.board import Board
-from checkers.rules import Move, PieceType, SideType, Point
+from checkers.encoding import encode_board
+from checkers.engine import Engine
+from checkers.renderer import BoardRenderer
+from checkers.search import Search
+from checkers.rules import Move, MoveRecord, SideType, Point
 from checkers.constants import *
-from rl.dqn import DQN, ReplayBuffer, train_dqn
-from rl.experience import Experience
 from tkinter import Canvas, Event, messagebox
-from PIL import Image, ImageTk
-from random import choice
-from pathlib import Path
-from math import inf
-from typing import List
+from concurrent.futures import Future
 from datetime import date
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    # torch is only imported when the DQN is needed
+    from rl.agent import DQNAgent
 
 
 class Game:
@@ -28,197 +32,206 @@ class Game:
             y_board_size (int): The number of rows on the game board.
         """
         self.__canvas = canvas
-        self.__board = Board(x_board_size, y_board_size)
+        self.__x_board_size = x_board_size
+        self.__y_board_size = y_board_size
+        self.__search = Search()
+        # moves predicted by the background thread of the enemy's turn
+        self.__enemy_moves_queue = queue.Queue()
+
+        # Create log file if it doesn't exist
+        file_name = f"./logs/log-{date.today()}.log"
+        open(file=file_name, mode="a").close()
+        # Configure logger
+        logging.basicConfig(filename=file_name, encoding="utf-8", level=logging.INFO)
+
+        # the DQN is loaded on a background thread, so the window shows up before torch is imported
+        self.__agent_future: Optional[Future] = None
+        # moves recorded while the agent loads, added to its replay buffer once it is loaded
+        self.__pending_transitions: list[tuple] = []
+        if AI_BACKEND == "dqn" or TRAIN_DQN:
+            self.__agent_future = Future()
+            threading.Thread(target=self.__load_agent, daemon=True).start()
+
+        self.__renderer = BoardRenderer(canvas, x_board_size, y_board_size)
 
-        # DQN and ReplayBuffer setup
-        input_size = x_board_size * y_board_size
-        output_size = len(MOVE_OFFSETS)
-        self.dqn = DQN(input_size, output_size)
-        self.optimizer = optim.Adam(self.dqn.parameters(), lr=LEARNING_RATE)
-        self.replay_buffer = ReplayBuffer(REPLAY_BUFFER_SIZE)
+        self.__reset()
+
+    def __reset(self):
+        """Start a new game.
+
+        Only the state of the game is reset, the DQN agent and the images are kept.
+        """
+        self.__board = Board(self.__x_board_size, self.__y_board_size)
+        self.__engine = Engine(self.__board, PLAYER_SIDE)
 
         self.__player_turn = True
+        # legal moves of the player indexed by source cell, None until computed
+        self.__player_moves: Optional[dict[Point, list[Move]]] = None
 
         self.__hovered_cell = Point()
         self.__selected_cell = Point()
         self.__animated_cell = Point()
 
-        # Store the current model reward
+        # total reward of the moves of the model (the enemy)
         self.__total_model_reward = 0.0
-        self.__previous_white_pieces = 0
-        self.__previous_black_pieces = 0
-
-        # Create log file if it doesn't exist
-        file_name = f"./logs/log-{date.today()}.log"
-        open(file=file_name, mode="a").close()
-        # Configure logger
-        logging.basicConfig(filename=file_name, encoding="utf-8", level=logging.INFO)
-
-        self.__init_images()
 
         self.__draw()
 
         if PLAYER_SIDE == SideType.BLACK:
             self.__handle_enemy_turn()
 
-    def __init_images(self):
-        """Initialize images.
+    def __load_agent(self):
+        """Import torch and create the DQN agent, on the background thread."""
+        start_time = time.perf_counter()
+        try:
+            from rl.agent import DQNAgent
+
+            agent = DQNAgent(self.__x_board_size, self.__y_board_size)
+        except Exception:
+            # the game goes on without the DQN
+            logging.exception("Failed to load the DQN")
+            self.__agent_future.set_result(None)
+            return
+
+        logging.info(f"Loaded the DQN in {time.perf_counter() - start_time:.3f}s")
+        self.__agent_future.set_result(agent)
 
-        This method initializes the images used in the game. It creates a dictionary
-        of images, where the keys are the piece types (WHITE_PIECE and BLACK_PIECE)
-        and the values are the corresponding image objects.
+    def __get_agent(self) -> Optional["DQNAgent"]:
+        """Get the DQN agent, waiting for it if it is still loading.
+
+        Only the background threads may wait, the UI thread uses __get_loaded_agent.
 
         Returns:
-            None
+            Optional[DQNAgent]: The agent, or None if the game runs without the DQN or it failed to load.
         """
-        self.__images = {
-            PieceType.WHITE_PIECE: ImageTk.PhotoImage(
-                Image.open(Path("assets", "white-piece.png")).resize(
-                    (CELL_SIZE, CELL_SIZE)
-                )
-            ),
-            PieceType.BLACK_PIECE: ImageTk.PhotoImage(
-                Image.open(Path("assets", "black-piece.png")).resize(
-                    (CELL_SIZE, CELL_SIZE)
-                )
-            ),
-        }
-
-    def __animate_move(self, move: Move):
-        """Animate the piece's movement
+        if self.__agent_future is None:
+            return None
+        return self.__agent_future.result()
 
-        Args:
-            move (Move): The move object representing the piece's movement.
+    def __get_loaded_agent(self) -> Optional["DQNAgent"]:
+        """Get the DQN agent without waiting, on the UI thread.
 
         Returns:
-            None
+            Optional[DQNAgent]: The agent, or None if the game runs without the DQN, it is still
+                loading or it failed to load.
+        """
+        if self.__agent_future is None or not (self.__agent_future.done()):
+            return None
+        return self.__agent_future.result()
+
+    def save_checkpoint(self):
+        """Save the DQN, the optimizer and the replay buffer, and export the policy for inference.
+
+        Nothing is saved without the DQN, or if it is still loading since it
+        was not trained yet.
+        """
+        agent = self.__get_loaded_agent()
+        if agent is not None:
+            agent.save_checkpoint()
+
+    def __animate_move(self, move: Move, callback: Callable, *args):
+        """Animate the piece's movement without blocking the event loop
+
+        The piece is moved on frames scheduled with after, its position being
+        interpolated from the elapsed time.
+
+        Args:
+            move (Move): The move object representing the piece's movement.
+            callback (Callable): The function called with args when the animation ends.
         """
         self.__animated_cell = Point(move.from_x, move.from_y)
         self.__draw()
 
-        # create a piece for the animation
-        animated_piece = self.__canvas.create_image(
-            move.from_x * CELL_SIZE,
-            move.from_y * CELL_SIZE,
-            image=self.__images.get(self.__board.type_at(move.from_x, move.from_y)),
-            anchor="nw",
-            tag="animated_piece",
+        # show a piece for the animation
+        self.__renderer.show_animated_piece(
+            move.from_x,
+            move.from_y,
+            self.__board.type_at(move.from_x, move.from_y),
         )
 
-        # movement vectors
-        dx = 1 if move.from_x < move.to_x else -1
-        dy = 1 if move.from_y < move.to_y else -1
+        self.__animation_frame(move, time.perf_counter(), callback, args)
 
-        # animation loop
-        for _distance in range(abs(move.from_x - move.to_x)):
-            for _ in range(100 // ANIMATION_SPEED):
-                self.__canvas.move(
-                    animated_piece,
-                    ANIMATION_SPEED / 100 * CELL_SIZE * dx,
-                    ANIMATION_SPEED / 100 * CELL_SIZE * dy,
-                )
-                self.__canvas.update()
+    def __animation_frame(
+        self, move: Move, start_time: float, callback: Callable, args: tuple
+    ):
+        """Draw a frame of the animation and schedule the next one.
 
+        Args:
+            move (Move): The animated move.
+            start_time (float): The time the animation started at.
+            callback (Callable): The function called with args when the animation ends.
+            args (tuple): The arguments of the callback.
+        """
+        duration = ANIMATION_DURATION * abs(move.to_x - move.from_x)
+        progress = min((time.perf_counter() - start_time) / duration, 1.0)
+
+        self.__renderer.move_animated_piece(
+            move.from_x + (move.to_x - move.from_x) * progress,
+            move.from_y + (move.to_y - move.from_y) * progress,
+        )
+
+        if progress < 1.0:
+            self.__canvas.after(
+                ANIMATION_FRAME_INTERVAL,
+                self.__animation_frame,
+                move,
+                start_time,
+                callback,
+                args,
+            )
+            return
+
+        self.__renderer.hide_animated_piece()
         self.__animated_cell = Point()
+        callback(*args)
 
     def __draw(self):
-        """Draw the board grid and the pieces"""
-        self.__canvas.delete("all")
-        self.__draw_board_grid()
-        self.__draw_pieces()
-
-    def __draw_board_grid(self):
-        """Draw the board grid.
+        """Draw the board grid and the pieces.
 
-        This method is responsible for drawing the grid of the game board on the canvas.
-        It iterates over each cell in the board and creates rectangles to represent the cells.
-        The color of each cell is determined by the BOARD_COLORS list.
-        If a cell is selected or hovered, a border is drawn around it using the SELECT_BORDER_COLOR or HOVER_BORDER_COLOR.
-        If a cell is selected, possible move circles are drawn on the cells where the player can move.
+        Only the canvas items that changed since the previous call are updated.
+        """
+        move_cells = []
+        if self.__board.is_within(self.__selected_cell.x, self.__selected_cell.y):
+            # draw possible move circles for the selected piece
+            move_cells = [
+                Point(move.to_x, move.to_y)
+                for move in self.__get_player_moves().get(self.__selected_cell, [])
+            ]
+
+        self.__renderer.draw(
+            self.__board,
+            self.__selected_cell,
+            self.__hovered_cell,
+            move_cells,
+            self.__animated_cell,
+        )
 
-        Args:
-            None
+    def __get_player_moves(self) -> dict[Point, list[Move]]:
+        """Get the legal moves of the player, computed once per position.
 
         Returns:
-            None
+            dict[Point, list[Move]]: The legal moves indexed by the cell of the moving piece.
         """
-        for y in range(self.__board.y_size):
-            for x in range(self.__board.x_size):
-                self.__canvas.create_rectangle(
-                    x * CELL_SIZE,
-                    y * CELL_SIZE,
-                    x * CELL_SIZE + CELL_SIZE,
-                    y * CELL_SIZE + CELL_SIZE,
-                    fill=BOARD_COLORS[(y + x) % 2],
-                    width=0,
-                    tag="boards",
-                )
-
-                # draw borders around the selected and hovered cells
-                if x == self.__selected_cell.x and y == self.__selected_cell.y:
-                    self.__canvas.create_rectangle(
-                        x * CELL_SIZE + BORDER_WIDTH // 2,
-                        y * CELL_SIZE + BORDER_WIDTH // 2,
-                        x * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                        y * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                        outline=SELECT_BORDER_COLOR,
-                        width=BORDER_WIDTH,
-                        tag="border",
-                    )
-                elif x == self.__hovered_cell.x and y == self.__hovered_cell.y:
-                    self.__canvas.create_rectangle(
-                        x * CELL_SIZE + BORDER_WIDTH // 2,
-                        y * CELL_SIZE + BORDER_WIDTH // 2,
-                        x * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                        y * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                        outline=HOVER_BORDER_COLOR,
-                        width=BORDER_WIDTH,
-                        tag="border",
-                    )
-
-                # draw possible move circles if a cell is selected
-                if self.__selected_cell:
-                    player_moves_list = self.__get_moves_list(PLAYER_SIDE)
-                    for move in player_moves_list:
-                        if (
-                            self.__selected_cell.x == move.from_x
-                            and self.__selected_cell.y == move.from_y
-                        ):
-                            self.__canvas.create_oval(
-                                move.to_x * CELL_SIZE + CELL_SIZE / 3,
-                                move.to_y * CELL_SIZE + CELL_SIZE / 3,
-                                move.to_x * CELL_SIZE + (CELL_SIZE - CELL_SIZE / 3),
-                                move.to_y * CELL_SIZE + (CELL_SIZE - CELL_SIZE / 3),
-                                fill=POSIBLE_MOVE_CIRCLE_COLOR,
-                                width=0,
-                                tag="posible_move_circle",
-                            )
-
-    def __draw_pieces(self):
-        """Draw the pieces on the board.
-
-        This method iterates over the cells of the board and draws the pieces on the canvas.
-        It skips drawing empty cells and the animated piece.
+        if self.__player_moves is None:
+            self.__player_moves = self.__index_moves(
+                self.__engine.get_moves_list(PLAYER_SIDE)
+            )
+        return self.__player_moves
+
+    @staticmethod
+    def __index_moves(moves_list: list[Move]) -> dict[Point, list[Move]]:
+        """Group moves by the cell of the moving piece.
 
         Args:
-            None
+            moves_list (list[Move]): The moves to group.
 
         Returns:
-            None
+            dict[Point, list[Move]]: The moves indexed by their source cell.
         """
-        for y in range(self.__board.y_size):
-            for x in range(self.__board.x_size):
-                # don't draw empty cells and the animated piece
-                if self.__board.type_at(x, y) != PieceType.NONE and not (
-                    x == self.__animated_cell.x and y == self.__animated_cell.y
-                ):
-                    self.__canvas.create_image(
-                        x * CELL_SIZE,
-                        y * CELL_SIZE,
-                        image=self.__images.get(self.__board.type_at(x, y)),
-                        anchor="nw",
-                        tag="pieces",
-                    )
+        moves = {}
+        for move in moves_list:
+            moves.setdefault(Point(move.from_x, move.from_y), []).append(move)
+        return moves
 
     def mouse_move(self, event: Event):
         """Mouse move event"""
@@ -263,206 +276,266 @@ class Game:
             move = Move(self.__selected_cell.x, self.__selected_cell.y, x, y)
 
             # if the player clicks on a cell the selected piece can move to
-            if move in self.__get_moves_list(PLAYER_SIDE):
-                self.__handle_player_turn(move)
-                self.__update_replay_buffer()
-                self.__train_dqn()
+            if move in self.__get_player_moves().get(self.__selected_cell, []):
+                state = self.get_flattened_state(PLAYER_SIDE)
 
-                if not (self.__player_turn):
-                    self.__handle_enemy_turn()
+                # ignore the clicks until the move is played
+                self.__player_turn = False
+                self.__animate_move(move, self.__handle_player_turn, move, state)
 
-    def __update_replay_buffer(self):
-        """Update the replay buffer with the current state, action, reward, and next state.
+    def __update_replay_buffer(
+        self,
+        side: SideType,
+        previous_state: np.ndarray,
+        move: Move,
+        record: MoveRecord,
+    ) -> float:
+        """Update the replay buffer with a move of either side.
+
+        This method adds the previous state, action, reward, next state, done flag, and next legal moves to the replay buffer of the agent.
+        The moves of both sides are recorded, like in self-play, so the actions of both directions are trained.
+        While the agent loads, the moves are queued instead of waiting for it on the UI thread.
+
+        Args:
+            side (SideType): The side that made the move.
+            previous_state (np.ndarray): The encoded state before the move, for the side.
+            move (Move): The move, already played.
+            record (MoveRecord): The record of the move.
 
-        This method converts the current state, action, reward, and next state into tensors and adds them to the replay buffer.
+        Returns:
+            float: The reward of the move for the side that made it.
         """
-        # convert the current state, action, reward, and next state to tensors
-        state = torch.tensor([self.__get_flattened_state()], dtype=torch.float32)
-        action = torch.tensor([self.__selected_action()], dtype=torch.long)
-        reward = torch.tensor([self.__calculate_reward()], dtype=torch.float32)
-        next_state = torch.tensor([self.__get_flattened_state()], dtype=torch.float32)
+        # the next legal moves are the jumps of the same piece, or the other side's moves
+        next_side = side
+        next_moves_list = []
+        if record.has_killed_piece:
+            next_moves_list = self.__engine.get_continuation_moves_list(move, side)
+        if not (next_moves_list):
+            next_side = SideType.opposite(side)
+            next_moves_list = self.__engine.get_moves_list(next_side)
+
+        # the side without valid moves loses
+        done = not (next_moves_list)
+        reward = self.__calculate_reward(record, done)
+
+        if self.__agent_future is None:
+            return reward
+
+        self.__pending_transitions.append(
+            (
+                previous_state,
+                move,
+                reward,
+                self.get_flattened_state(next_side),
+                done,
+                next_moves_list,
+                next_side == side,
+            )
+        )
+        if not (self.__agent_future.done()):
+            return reward
 
-        experience = Experience(state, action, reward, next_state)
-        self.replay_buffer.push(experience)  # add the experience to the replay buffer
+        # the transitions are dropped if the agent failed to load
+        agent = self.__get_loaded_agent()
+        if agent is not None:
+            for transition in self.__pending_transitions:
+                agent.remember(*transition)
+        self.__pending_transitions.clear()
 
-    def __train_dqn(self):
-        """ "Train the DQN using the replay buffer"""
-        train_dqn(self.dqn, self.replay_buffer, BATCH_SIZE, GAMMA, self.optimizer)
+        return reward
 
-    def __get_flattened_state(self):
-        """Get the flattened representation of the current game state.
+    def __train_dqn(self):
+        """ "Train the DQN using the replay buffer, if the agent is loaded"""
+        agent = self.__get_loaded_agent()
+        if agent is not None:
+            agent.train()
 
-        Returns:
-            list: A list containing the piece types of each position on the board.
-        """
-        state = []
-        for y in range(self.__board.y_size):
-            for x in range(self.__board.x_size):
-                piece_type = self.__board.type_at(x, y).value
-                state.append(piece_type)
-        return state
+    @staticmethod
+    def __calculate_reward(record: MoveRecord, done: bool) -> float:
+        """Calculate the reward of a move for the side that made it, like the self-play environment.
 
-    def __selected_action(self):
-        """Select the action with the highest Q-value for the current state.
+        Args:
+            record (MoveRecord): The record of the move.
+            done (bool): True if the move won the game.
 
         Returns:
-            int: The index of the selected action.
+            float: CAPTURE_REWARD per killed piece, plus WIN_REWARD if the move won.
         """
-        # use epsilon-greedy strategy for action selection
-        epsilon = EPSILON
-        if random.random() < epsilon:
-            return random.randint(0, len(MOVE_OFFSETS) - 1)
-        else:
-            # get the Q-values for the current state
-            state = torch.tensor([self.__get_flattened_state()], dtype=torch.float32)
-            q_values = self.dqn(state)
-            # select the action with the highest Q-value
-            return torch.argmax(q_values).item()
-
-    def __calculate_reward(self):
-        """Calculate the reward for the current game state"""
-        white_score = self.__board.white_score
-        black_score = self.__board.black_score
-        # don't update reward if nothing happend with the number of pieces from the both sides
-        if (
-            self.__previous_black_pieces == black_score
-            and self.__previous_white_pieces == white_score
-        ):
-            return self.__total_model_reward
-
-        # update the reward according to the game status
-        if white_score > black_score:
-            self.__total_model_reward -= 1
-        if white_score < black_score:
-            self.__total_model_reward += 1
-        if white_score == black_score:
-            self.__total_model_reward += 0.5
-
-        # save the current number of pieces for the next iteration
-        self.__previous_white_pieces = white_score
-        self.__previous_black_pieces = black_score
-        return self.__total_model_reward
-
-    def __handle_move(self, move: Move, draw: bool = True) -> bool:
-        """Move a piece from one cell to another.
+        reward = CAPTURE_REWARD * len(record.captured)
+        if done:
+            reward += WIN_REWARD
+        return reward
+
+    def __handle_move(self, move: Move) -> MoveRecord:
+        """Move a piece from one cell to another and draw the new position.
 
         Args:
             move (Move): The move object containing the coordinates of the piece to be moved.
-            draw (bool, optional): Indicates whether to animate and draw the move. Defaults to True.
 
         Returns:
-            bool: True if a piece was killed during the move, False otherwise.
+            MoveRecord: The record of the move, which can be used to undo it.
         """
-        if draw:
-            self.__animate_move(move)
+        record = self.__engine.handle_move(move)
+        # the legal moves of the player changed with the position
+        self.__player_moves = None
 
-        # change the position of the piece
-        self.__board.at(move.to_x, move.to_y).change_type(
-            self.__board.type_at(move.from_x, move.from_y)
-        )
-        self.__board.at(move.from_x, move.from_y).change_type(PieceType.NONE)
-
-        # movement vectors
-        dx = -1 if move.from_x < move.to_x else 1
-        dy = -1 if move.from_y < move.to_y else 1
-
-        # delete the killed piece
-        has_killed_piece = False
-        x, y = move.to_x, move.to_y
-        while x != move.from_x or y != move.from_y:
-            x += dx
-            y += dy
-            if self.__board.type_at(x, y) != PieceType.NONE:
-                self.__board.at(x, y).change_type(PieceType.NONE)
-                has_killed_piece = True
-
-        if draw:
-            self.__draw()
+        self.__draw()
 
-        return has_killed_piece
+        return record
 
-    def __handle_player_turn(self, move: Move):
-        """Handle the player's turn.
+    def __handle_player_turn(self, move: Move, state: np.ndarray):
+        """Handle the player's move once its animation is over.
 
         Args:
             move (Move): The move made by the player.
+            state (np.ndarray): The encoded state before the move.
 
         Returns:
             None
         """
-        self.__player_turn = False
-
         # check if the player killed a piece
-        has_killed_piece = self.__handle_move(move)
-
-        required_moves_list = list(
-            filter(
-                lambda required_move: move.to_x == required_move.from_x
-                and move.to_y == required_move.from_y,
-                self.__get_required_moves_list(PLAYER_SIDE),
-            )
-        )
+        record = self.__handle_move(move)
 
         # check if the player can move again with the same piece
-        if has_killed_piece and required_moves_list:
-            self.__player_turn = True
+        if record.has_killed_piece:
+            required_moves_list = self.__engine.get_continuation_moves_list(
+                move, PLAYER_SIDE
+            )
+            if required_moves_list:
+                self.__player_turn = True
+                # only the jumps of the same piece are legal until the turn ends
+                self.__player_moves = self.__index_moves(required_moves_list)
 
         self.__selected_cell = Point()
 
+        self.__update_replay_buffer(PLAYER_SIDE, state, move, record)
+        self.__train_dqn()
+
+        if not (self.__player_turn):
+            self.__handle_enemy_turn()
+
     def __handle_enemy_turn(self):
         """Handle the enemy's turn (computer)
 
-        This method is responsible for handling the enemy's turn in the game. It sets the player's turn to False,
-        predicts the optimal moves for the enemy using the __predict_optimal_moves method, and then handles each move
-        by calling the __handle_move method. After all the moves are handled, it sets the player's turn back to True
-        and checks for game over.
-
+        The moves are predicted on a background thread, so the window stays
+        responsive during long searches. The thread sends them back through a
+        queue polled with after, then they are animated and played one by one.
+        When the turn is over, the player's turn starts and the game over is checked.
         """
         self.__player_turn = False
 
-        optimal_moves_list = self.__predict_optimal_moves(
-            SideType.opposite(PLAYER_SIDE)
-        )
+        threading.Thread(
+            target=self.__predict_enemy_moves,
+            args=(SideType.opposite(PLAYER_SIDE),),
+            daemon=True,
+        ).start()
+        self.__canvas.after(AI_POLL_INTERVAL, self.__poll_enemy_moves)
 
-        for move in optimal_moves_list:
-            print(f"Move: {move} | Reward: {self.__total_model_reward}")
-            logging.info(f"Move: {move} | Reward: {self.__total_model_reward}")
-            self.__handle_move(move)
+    def __predict_enemy_moves(self, side: SideType):
+        """Predict the moves of the enemy and put them in the queue, on the background thread.
 
-        self.__player_turn = True
+        Args:
+            side (SideType): The side for which to predict the moves.
+        """
+        try:
+            optimal_moves_list = None
+            agent = self.__get_agent() if AI_BACKEND == "dqn" else None
+            if agent is not None:
+                try:
+                    optimal_moves_list = agent.predict_moves(self.__board, side)
+                except Exception:
+                    logging.exception("The DQN failed to predict the moves")
+
+            if optimal_moves_list is None:
+                # the search also replaces a DQN that failed to load or to predict
+                optimal_moves_list = self.__predict_optimal_moves(side)
+        except Exception as exception:
+            # handled on the UI thread
+            self.__enemy_moves_queue.put(exception)
+            return
+
+        self.__enemy_moves_queue.put(optimal_moves_list)
+
+    def __poll_enemy_moves(self):
+        """Play the moves of the enemy if they were predicted, or poll the queue again later."""
+        try:
+            optimal_moves_list = self.__enemy_moves_queue.get_nowait()
+        except queue.Empty:
+            self.__canvas.after(AI_POLL_INTERVAL, self.__poll_enemy_moves)
+            return
+
+        if isinstance(optimal_moves_list, Exception):
+            # raising in an after callback would freeze the game, so the enemy passes its turn
+            logging.error(
+                "Failed to predict the moves of the enemy", exc_info=optimal_moves_list
+            )
+            optimal_moves_list = []
+
+        self.__play_enemy_moves(optimal_moves_list)
+
+    def __play_enemy_moves(self, moves: list[Move]):
+        """Animate and play the remaining moves of the enemy's turn, then end it.
+
+        Args:
+            moves (list[Move]): The moves left to play.
+        """
+        if not (moves):
+            self.__player_turn = True
+            self.__check_for_game_over()
+            return
+
+        move = moves[0]
+        print(f"Move: {move} | Reward: {self.__total_model_reward}")
+        logging.info(f"Move: {move} | Reward: {self.__total_model_reward}")
+        self.__animate_move(move, self.__play_enemy_move, move, moves[1:])
+
+    def __play_enemy_move(self, move: Move, next_moves: list[Move]):
+        """Play an animated move of the enemy, then animate the next one.
+
+        Args:
+            move (Move): The animated move.
+            next_moves (list[Move]): The moves left to play after it.
+        """
+        side = SideType.opposite(PLAYER_SIDE)
+        state = self.get_flattened_state(side)
+        record = self.__handle_move(move)
 
-        self.__check_for_game_over()
+        # the DQN also learns from the moves of the enemy
+        self.__total_model_reward += self.__update_replay_buffer(
+            side, state, move, record
+        )
+        self.__train_dqn()
+
+        self.__play_enemy_moves(next_moves)
 
     def __check_for_game_over(self):
         """Check if the game is over.
 
         This method checks if the game is over by checking if there are any valid moves left for both the white and black sides.
         If there are no valid moves left for either side, the game is considered over and a message box is displayed to indicate the winner.
-        If the game is over, a new game is initialized.
+        If the game is over, the checkpoint is saved and a new game is started.
 
         """
         game_over = False
 
-        white_moves_list = self.__get_moves_list(SideType.WHITE)
-        if not (white_moves_list):
+        winner = self.__engine.get_winner()
+        if winner == SideType.BLACK:
             # white lost
             messagebox.showinfo("Game Over", "The black pieces won!")
             game_over = True
             logging.info("BLACK WON")
-            exit()
 
-        black_moves_list = self.__get_moves_list(SideType.BLACK)
-        if not (black_moves_list):
+        if winner == SideType.WHITE:
             # black lost
             messagebox.showinfo("Game Over", "The white pieces won!")
             game_over = True
             logging.info("WHITE WON")
-            exit()
 
         if game_over:
-            # new game
+            # keep what was learned, then start a new game
+            self.save_checkpoint()
             logging.info("RESET")
-            self.__init__(self.__canvas, self.__board.x_size, self.__board.y_size)
+            self.__reset()
 
     def __predict_optimal_moves(self, side: SideType) -> list[Move]:
         """Predict the optimal move for the enemy side.
@@ -474,222 +547,19 @@ class Game:
             list[Move]: A list of optimal moves.
 
         """
-        best_result = 0
-        # temporal optimal moves, will be filtered later
-        optimal_moves = []
-        predicted_moves_list = self.__get_predicted_moves_list(side)
-
-        if predicted_moves_list:
-            # make a copy of the board before the moves iteration
-            board_copy = Board.copy(self.__board)
-            for moves in predicted_moves_list:
-                for move in moves:
-                    self.__handle_move(move, draw=False)
-
-                try:
-                    if side == SideType.WHITE:
-                        result = self.__board.white_score / self.__board.black_score
-                    elif side == SideType.BLACK:
-                        result = self.__board.black_score / self.__board.white_score
-                except ZeroDivisionError:
-                    result = inf
-
-                if result > best_result:
-                    best_result = result
-                    optimal_moves.clear()
-                    optimal_moves.append(moves)
-                elif result == best_result:
-                    optimal_moves.append(moves)
-
-                # reset the game board to the previous state
-                self.__board = Board.copy(board_copy)
-
-        # final optional moves
-        optimal_move = []
-        if optimal_moves:
-            # filter the moves that kills the most pieces
-            for move in choice(optimal_moves):
-                if (
-                    side == SideType.WHITE
-                    and self.__board.type_at(move.from_x, move.from_y) in BLACK_PIECES
-                    or side == SideType.BLACK
-                    and self.__board.type_at(move.from_x, move.from_y) in WHITE_PIECES
-                ):
-                    break
-                #  usually there is only one move, but can be more
-                optimal_move.append(move)
-
-        return optimal_move
-
-    def __get_predicted_moves_list(
-        self,
-        side: SideType,
-        current_prediction_depth: int = 0,
-        all_moves_list: list[Move] = [],
-        current_moves_list: list[Move] = [],
-        required_moves_list: list[Move] = [],
-    ) -> list[Move]:
-        """
-        Predict all possible moves.
-
-        Args:
-            side (SideType): The side for which to predict moves.
-            current_prediction_depth (int, optional): The current depth of prediction. Defaults to 0.
-            all_moves_list (list[Move], optional): The list to store all predicted moves. Defaults to [].
-            current_moves_list (list[Move], optional): The list to store the current moves being considered. Defaults to [].
-            required_moves_list (list[Move], optional): The list of required moves for a piece. Defaults to [].
-
-        Returns:
-            list[Move]: The list of all predicted moves.
-        """
-        if current_moves_list:
-            all_moves_list.append(current_moves_list)
-        else:
-            all_moves_list.clear()
-
-        if required_moves_list:
-            moves_list = required_moves_list
-        else:
-            moves_list = self.__get_moves_list(side)
-
-        if moves_list and current_prediction_depth < MAX_PREDICTION_DEPTH:
-            board_copy = Board.copy(self.__board)
-            for move in moves_list:
-                has_killed_piece = self.__handle_move(move, draw=False)
-
-                required_moves_list = list(
-                    filter(
-                        lambda required_move: move.to_x == required_move.from_x
-                        and move.to_y == required_move.from_y,
-                        self.__get_required_moves_list(side),
-                    )
-                )
-
-                # check if the current piece can move again
-                if has_killed_piece and required_moves_list:
-                    self.__get_predicted_moves_list(
-                        side,
-                        current_prediction_depth,
-                        all_moves_list,
-                        current_moves_list + [move],
-                        required_moves_list,
-                    )
-                else:
-                    self.__get_predicted_moves_list(
-                        SideType.opposite(side),
-                        current_prediction_depth + 1,
-                        all_moves_list,
-                        current_moves_list + [move],
-                    )
-
-                self.__board = Board.copy(board_copy)
-
-        return all_moves_list
-
-    def __get_moves_list(self, side: SideType) -> list[Move]:
-        """Get the list of moves for the specified side.
+        result = self.__search.search(self.__board, side)
+        logging.info(f"Search: {result}")
 
-        Args:
-            side (SideType): The side for which to get the moves.
+        #  usually there is only one move, but can be more
+        return result.moves
 
-        Returns:
-            list[Move]: The list of moves for the specified side.
-        """
-        moves_list = self.__get_required_moves_list(side)
-        if not (moves_list):
-            moves_list = self.__get_optional_moves_list(side)
-        return moves_list
-
-    def __get_required_moves_list(self, side: SideType) -> list[Move]:
-        """Get the list of mandatory moves.
-
-        Args:
-            side (SideType): The side for which to get the mandatory moves.
-
-        Returns:
-            list[Move]: The list of mandatory moves.
-        """
-        moves_list = []
-
-        if side == SideType.WHITE:
-            friendly_pieces = WHITE_PIECES
-            enemy_pieces = BLACK_PIECES
-        elif side == SideType.BLACK:
-            friendly_pieces = BLACK_PIECES
-            enemy_pieces = WHITE_PIECES
-        else:
-            return moves_list
-
-        for y in range(self.__board.y_size):
-            for x in range(self.__board.x_size):
-                if self.__board.type_at(x, y) == friendly_pieces[0]:
-                    for offset in MOVE_OFFSETS:
-                        if not (
-                            self.__board.is_within(x + offset.x * 2, y + offset.y * 2)
-                        ):
-                            continue
-
-                        # check if the enemy piece is in front and an empty space is two steps ahead
-                        if (
-                            self.__board.type_at(x + offset.x, y + offset.y)
-                            in enemy_pieces
-                            and self.__board.type_at(x + offset.x * 2, y + offset.y * 2)
-                            == PieceType.NONE
-                            and (
-                                offset.y < 0 if side == SideType.WHITE else offset.y > 0
-                            )
-                        ):
-                            moves_list.append(
-                                Move(x, y, x + offset.x * 2, y + offset.y * 2)
-                            )
-
-        return moves_list
-
-    def __get_optional_moves_list(self, side: SideType) -> list[Move]:
-        """Get the list of optional moves for a given side.
+    def get_flattened_state(self, side: SideType = PLAYER_SIDE) -> np.ndarray:
+        """Get the flattened representation of the current game state.
 
         Args:
-            side (SideType): The side for which to get the optional moves.
-
-        Returns:
-            list[Move]: The list of optional moves.
-
-        """
-        moves_list = []
-
-        if side == SideType.WHITE:
-            friendly_pieces = WHITE_PIECES
-        elif side == SideType.BLACK:
-            friendly_pieces = BLACK_PIECES
-        else:
-            return moves_list
-
-        for y in range(self.__board.y_size):
-            for x in range(self.__board.x_size):
-                if self.__board.type_at(x, y) == friendly_pieces[0]:
-                    for offset in (
-                        MOVE_OFFSETS[:2] if side == SideType.WHITE else MOVE_OFFSETS[2:]
-                    ):
-                        if not (self.__board.is_within(x + offset.x, y + offset.y)):
-                            continue
-
-                        if (
-                            self.__board.type_at(x + offset.x, y + offset.y)
-                            == PieceType.NONE
-                        ):
-                            moves_list.append(Move(x, y, x + offset.x, y + offset.y))
-
-        return moves_list
-
-    def get_flattened_state(self) -> List[int]:
-        """Get the flattened representation of the current game state.
+            side (SideType, optional): The side to move. Defaults to PLAYER_SIDE.
 
         Returns:
-            List[int]: A list of integers representing the piece types in the game state.
+            np.ndarray: The read-only planes of checkers.encoding.encode_board.
         """
-        state = []
-        for y in range(self.__board.y_size):
-            for x in range(self.__board.x_size):
-                piece_type = self.__board.type_at(x, y).value
-                state.append(piece_type)
-        return state
+        return encode_board(self.__board, side)
@@ -0,0 +1,223 @@
+import argparse
+import sys
+import time
+
+from checkers.board import Board
+from checkers.engine import Engine
+from checkers.rules import PieceType, SideType
+from typing import NamedTuple, Optional
+
+# characters of the piece types in the diagrams of the positions
+DIAGRAM_PIECES = {
+    ".": PieceType.NONE,
+    "w": PieceType.WHITE_PIECE,
+    "b": PieceType.BLACK_PIECE,
+}
+
+
+class PerftPosition(NamedTuple):
+    """
+    A position with the known number of leaf nodes of its game tree.
+
+    Attributes:
+        name (str): The name of the position.
+        rows (tuple[str, ...]): The diagram of the board, one string per row from the top,
+            using the characters of DIAGRAM_PIECES. None for the starting position.
+        side (SideType): The side to move.
+        counts (tuple[int, ...]): The number of leaf nodes at depth 1, 2, ...
+        x_size (int): The size of the board along the x-axis.
+        y_size (int): The size of the board along the y-axis.
+    """
+
+    name: str
+    rows: Optional[tuple[str, ...]]
+    side: SideType
+    counts: tuple[int, ...]
+    x_size: int
+    y_size: int
+
+
+# a turn (a step or a whole sequence of jumps) is one ply, the counts were
+# checked against the original cell-by-cell move generation
+POSITIONS = [
+    PerftPosition(
+        "start 6x6",
+        None,
+        SideType.WHITE,
+        (5, 25, 106, 369, 1271, 4104),
+        6,
+        6,
+    ),
+    PerftPosition(
+        "midgame 6x6",
+        (".b.b..", "....b.", ".....b", "..w...", ".w...b", "b...w."),
+        SideType.BLACK,
+        (5, 17, 55, 143, 401, 999),
+        6,
+        6,
+    ),
+    PerftPosition(
+        "captures 6x6",
+        (".b.b..", "b.....", "...b.b", "......", ".w.w.w", "w.w..."),
+        SideType.WHITE,
+        (5, 16, 39, 124, 362, 1059),
+        6,
+        6,
+    ),
+    PerftPosition(
+        "double jumps 6x6",
+        (".b....", "......", ".b.b..", "......", ".b....", "w...w."),
+        SideType.WHITE,
+        (2, 7, 23, 61, 132, 373, 623, 1553),
+        6,
+        6,
+    ),
+    PerftPosition(
+        "start 8x8",
+        None,
+        SideType.WHITE,
+        (7, 49, 392, 3136, 26592, 218695),
+        8,
+        8,
+    ),
+    PerftPosition(
+        "midgame 8x8",
+        (
+            ".b...b.b",
+            "b.b.....",
+            ".b.b.b..",
+            "........",
+            ".w.w....",
+            "........",
+            ".w...w.w",
+            "w...w.w.",
+        ),
+        SideType.BLACK,
+        (9, 61, 280, 1756, 8561),
+        8,
+        8,
+    ),
+    PerftPosition(
+        "captures 8x8",
+        (
+            ".b.b.b.b",
+            "b.b.b...",
+            "........",
+            "........",
+            "...w.w..",
+            "....w...",
+            ".w.w....",
+            "w...w.w.",
+        ),
+        SideType.BLACK,
+        (7, 70, 489, 3797, 23590),
+        8,
+        8,
+    ),
+]
+
+
+def board_from_rows(rows: tuple[str, ...]) -> Board:
+    """Create a board from a diagram.
+
+    Args:
+        rows (tuple[str, ...]): One string per row from the top, using the characters of DIAGRAM_PIECES.
+
+    Returns:
+        Board: The board of the diagram.
+    """
+    board = Board(len(rows[0]), len(rows))
+    for y, row in enumerate(rows):
+        for x, piece in enumerate(row):
+            board.set_type_at(x, y, DIAGRAM_PIECES[piece])
+    return board
+
+
+def perft(engine: Engine, side: SideType, depth: int) -> int:
+    """Count the leaf nodes of the game tree.
+
+    Args:
+        engine (Engine): The engine holding the position.
+        side (SideType): The side to move.
+        depth (int): The number of turns to play.
+
+    Returns:
+        int: The number of different sequences of depth turns.
+    """
+    if depth == 0:
+        return 1
+
+    turns_list = engine.get_turns_list(side)
+    if depth == 1:
+        return len(turns_list)
+
+    nodes = 0
+    for turn in turns_list:
+        records = engine.make_turn(turn)
+        nodes += perft(engine, SideType.opposite(side), depth - 1)
+        engine.undo_turn(records)
+    return nodes
+
+
+def run_perft(
+    positions: list[PerftPosition] = POSITIONS, max_depth: Optional[int] = None
+) -> bool:
+    """Count the leaf nodes of the positions and compare them to the known counts.
+
+    Args:
+        positions (list[PerftPosition], optional): The positions to check. Defaults to POSITIONS.
+        max_depth (int, optional): The maximum depth. Defaults to the deepest known count.
+
+    Returns:
+        bool: True if all counts match, False otherwise.
+    """
+    all_passed = True
+    total_nodes = 0
+    total_time = 0.0
+
+    for position in positions:
+        if position.rows is None:
+            board = Board(position.x_size, position.y_size)
+        else:
+            board = board_from_rows(position.rows)
+        engine = Engine(board, position.side)
+
+        for depth, expected in enumerate(position.counts[:max_depth], start=1):
+            start_time = time.perf_counter()
+            nodes = perft(engine, position.side, depth)
+            elapsed = time.perf_counter() - start_time
+
+            total_nodes += nodes
+            total_time += elapsed
+            passed = nodes == expected
+            all_passed &= passed
+
+            print(
+                f"{position.name:<18} depth {depth} | {nodes:>8} nodes | "
+                f"{nodes / max(elapsed, 1e-9):>9.0f} nodes/s | "
+                + ("ok" if passed else f"FAILED, expected {expected}")
+            )
+
+    print(
+        f"total {total_nodes} nodes in {total_time:.2f}s | "
+        f"{total_nodes / max(total_time, 1e-9):.0f} nodes/s"
+    )
+    return all_passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check the move generation against known perft counts."
+    )
+    parser.add_argument("--depth", type=int, help="maximum depth of every position")
+    parser.add_argument(
+        "--size", type=int, help="only check the positions of this board size"
+    )
+    arguments = parser.parse_args()
+
+    positions = [
+        position
+        for position in POSITIONS
+        if arguments.size is None or position.x_size == arguments.size
+    ]
+    sys.exit(0 if run_perft(positions, arguments.depth) else 1)
@@ -0,0 +1,228 @@
+from checkers.board import Board
+from checkers.sprites import get_sprite
+from checkers.rules import PieceType, Point
+from checkers.constants import (
+    CELL_SIZE,
+    BORDER_WIDTH,
+    BOARD_COLORS,
+    HOVER_BORDER_COLOR,
+    SELECT_BORDER_COLOR,
+    POSIBLE_MOVE_CIRCLE_COLOR,
+)
+from tkinter import Canvas, HIDDEN, NORMAL
+
+
+class BoardRenderer:
+    """
+    Draws a board on a canvas in retained mode.
+
+    Every canvas item is created once: a square, a possible move circle and a
+    piece image per cell, the hover and selection borders, and the animated
+    piece. Drawing a state only reconfigures the items that changed since the
+    previous one.
+    """
+
+    def __init__(self, canvas: Canvas, x_size: int, y_size: int):
+        """
+        Initializes a new instance of the BoardRenderer class and creates the canvas items.
+
+        Args:
+            canvas (Canvas): The canvas to draw on.
+            x_size (int): The number of columns of the board.
+            y_size (int): The number of rows of the board.
+        """
+        self.__canvas = canvas
+        self.__x_size = x_size
+        self.__y_size = y_size
+
+        for y in range(y_size):
+            for x in range(x_size):
+                canvas.create_rectangle(
+                    x * CELL_SIZE,
+                    y * CELL_SIZE,
+                    x * CELL_SIZE + CELL_SIZE,
+                    y * CELL_SIZE + CELL_SIZE,
+                    fill=BOARD_COLORS[(y + x) % 2],
+                    width=0,
+                    tag="boards",
+                )
+
+        self.__select_border = self.__create_border(SELECT_BORDER_COLOR)
+        self.__hover_border = self.__create_border(HOVER_BORDER_COLOR)
+
+        # items of every cell, indexed like the bits of the board masks
+        self.__circles = [
+            canvas.create_oval(
+                x * CELL_SIZE + CELL_SIZE / 3,
+                y * CELL_SIZE + CELL_SIZE / 3,
+                x * CELL_SIZE + (CELL_SIZE - CELL_SIZE / 3),
+                y * CELL_SIZE + (CELL_SIZE - CELL_SIZE / 3),
+                fill=POSIBLE_MOVE_CIRCLE_COLOR,
+                width=0,
+                state=HIDDEN,
+                tag="posible_move_circle",
+            )
+            for y in range(y_size)
+            for x in range(x_size)
+        ]
+        self.__pieces = [
+            canvas.create_image(
+                x * CELL_SIZE, y * CELL_SIZE, anchor="nw", state=HIDDEN, tag="pieces"
+            )
+            for y in range(y_size)
+            for x in range(x_size)
+        ]
+        self.__animated_piece = canvas.create_image(
+            0, 0, anchor="nw", state=HIDDEN, tag="animated_piece"
+        )
+
+        # drawn state: piece type per cell, cells of the circles and of the borders
+        self.__piece_types = [PieceType.NONE] * (x_size * y_size)
+        self.__circle_cells: set[Point] = set()
+        self.__select_cell = Point()
+        self.__hover_cell = Point()
+
+    def draw(
+        self,
+        board: Board,
+        selected_cell: Point,
+        hovered_cell: Point,
+        move_cells: list[Point],
+        animated_cell: Point = Point(),
+    ):
+        """Update the items whose state changed.
+
+        Args:
+            board (Board): The board to draw.
+            selected_cell (Point): The selected cell, outside the board if none.
+            hovered_cell (Point): The hovered cell, outside the board if none.
+            move_cells (list[Point]): The cells where the selected piece can move.
+            animated_cell (Point, optional): The cell whose piece is animated and not drawn there.
+                Defaults to none.
+        """
+        for y in range(board.y_size):
+            for x in range(board.x_size):
+                piece_type = board.type_at(x, y)
+                if x == animated_cell.x and y == animated_cell.y:
+                    piece_type = PieceType.NONE
+                self.__set_piece(y * self.__x_size + x, piece_type)
+
+        # only the selected cell is bordered if it is also hovered
+        if hovered_cell == selected_cell:
+            hovered_cell = Point()
+        self.__select_cell = self.__move_border(
+            self.__select_border, self.__select_cell, selected_cell
+        )
+        self.__hover_cell = self.__move_border(
+            self.__hover_border, self.__hover_cell, hovered_cell
+        )
+
+        move_cells = set(move_cells)
+        for cell in self.__circle_cells - move_cells:
+            self.__canvas.itemconfig(
+                self.__circles[cell.y * self.__x_size + cell.x], state=HIDDEN
+            )
+        for cell in move_cells - self.__circle_cells:
+            self.__canvas.itemconfig(
+                self.__circles[cell.y * self.__x_size + cell.x], state=NORMAL
+            )
+        self.__circle_cells = move_cells
+
+    def show_animated_piece(self, x: int, y: int, piece_type: PieceType) -> int:
+        """Show the animated piece on a cell, above every other item.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            piece_type (PieceType): The type of the animated piece.
+
+        Returns:
+            int: The canvas item of the animated piece, to move it.
+        """
+        self.__canvas.coords(self.__animated_piece, x * CELL_SIZE, y * CELL_SIZE)
+        self.__canvas.itemconfig(
+            self.__animated_piece,
+            image=get_sprite(piece_type, CELL_SIZE),
+            state=NORMAL,
+        )
+        return self.__animated_piece
+
+    def move_animated_piece(self, x: float, y: float):
+        """Move the animated piece.
+
+        Args:
+            x (float): The x-coordinate of the piece, in cells.
+            y (float): The y-coordinate of the piece, in cells.
+        """
+        self.__canvas.coords(self.__animated_piece, x * CELL_SIZE, y * CELL_SIZE)
+
+    def hide_animated_piece(self):
+        """Hide the animated piece."""
+        self.__canvas.itemconfig(self.__animated_piece, state=HIDDEN)
+
+    def __create_border(self, color: str) -> int:
+        """Create a hidden cell border.
+
+        Args:
+            color (str): The color of the border.
+
+        Returns:
+            int: The canvas item of the border.
+        """
+        return self.__canvas.create_rectangle(
+            BORDER_WIDTH // 2,
+            BORDER_WIDTH // 2,
+            CELL_SIZE - BORDER_WIDTH // 2,
+            CELL_SIZE - BORDER_WIDTH // 2,
+            outline=color,
+            width=BORDER_WIDTH,
+            state=HIDDEN,
+            tag="border",
+        )
+
+    def __move_border(self, border: int, drawn_cell: Point, cell: Point) -> Point:
+        """Move a border to a cell, or hide it if the cell is outside the board.
+
+        Args:
+            border (int): The canvas item of the border.
+            drawn_cell (Point): The cell the border is drawn on.
+            cell (Point): The cell to draw the border on.
+
+        Returns:
+            Point: The cell the border is drawn on after the call.
+        """
+        if cell == drawn_cell:
+            return cell
+
+        if 0 <= cell.x < self.__x_size and 0 <= cell.y < self.__y_size:
+            self.__canvas.coords(
+                border,
+                cell.x * CELL_SIZE + BORDER_WIDTH // 2,
+                cell.y * CELL_SIZE + BORDER_WIDTH // 2,
+                cell.x * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
+                cell.y * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
+            )
+            self.__canvas.itemconfig(border, state=NORMAL)
+        else:
+            self.__canvas.itemconfig(border, state=HIDDEN)
+        return cell
+
+    def __set_piece(self, index: int, piece_type: PieceType):
+        """Change the piece image of a cell if its type changed.
+
+        Args:
+            index (int): The index of the cell.
+            piece_type (PieceType): The type of the piece on the cell.
+        """
+        if self.__piece_types[index] == piece_type:
+            return
+
+        if piece_type == PieceType.NONE:
+            self.__canvas.itemconfig(self.__pieces[index], state=HIDDEN)
+        else:
+            self.__canvas.itemconfig(
+                self.__pieces[index],
+                image=get_sprite(piece_type, CELL_SIZE),
+                state=NORMAL,
+            )
+        self.__piece_types[index] = piece_type
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import NamedTuple
 
 
 class SideType(Enum):
@@ -43,6 +44,8 @@ class Checker:
     Represents a checker piece in the game of checkers.
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, type: PieceType = PieceType.NONE):
         self.type = type
 
@@ -56,35 +59,29 @@ class Checker:
         self.type = type
 
 
-class Point:
-    def __init__(self, x: int = -1, y: int = -1):
-        """
-        Initializes a Point object with x and y coordinates.
-
-        Args:
-            x (int): The x-coordinate of the point. Default is -1.
-            y (int): The y-coordinate of the point. Default is -1.
-        """
-        self.x = x
-        self.y = y
+class Point(NamedTuple):
+    """
+    Represents a cell of the board, or an offset between two cells.
 
-    def __eq__(self, other):
-        """
-        Checks if two Point objects are equal.
+    Points are immutable tuples, so comparing and hashing them is done in C
+    and they can be used in sets and as dict keys.
 
-        Args:
-            other (Point): The other Point object to compare with.
+    Attributes:
+        x (int): The x-coordinate of the point. Default is -1.
+        y (int): The y-coordinate of the point. Default is -1.
+    """
 
-        Returns:
-            bool: True if the two Point objects are equal, False otherwise.
-        """
-        return isinstance(other, Point) and self.x == other.x and self.y == other.y
+    x: int = -1
+    y: int = -1
 
 
-class Move:
+class Move(NamedTuple):
     """
     Represents a move in a checkers game.
 
+    Moves are immutable tuples, so comparing and hashing them is done in C
+    and they can be used in sets and as dict keys.
+
     Attributes:
         from_x (int): The x-coordinate of the starting position.
         from_y (int): The y-coordinate of the starting position.
@@ -92,22 +89,10 @@ class Move:
         to_y (int): The y-coordinate of the destination position.
     """
 
-    def __init__(
-        self, from_x: int = -1, from_y: int = -1, to_x: int = -1, to_y: int = -1
-    ):
-        """
-        Initialize a Move object.
-
-        Args:
-            from_x (int): The x-coordinate of the starting position.
-            from_y (int): The y-coordinate of the starting position.
-            to_x (int): The x-coordinate of the destination position.
-            to_y (int): The y-coordinate of the destination position.
-        """
-        self.from_x = from_x
-        self.from_y = from_y
-        self.to_x = to_x
-        self.to_y = to_y
+    from_x: int = -1
+    from_y: int = -1
+    to_x: int = -1
+    to_y: int = -1
 
     def __str__(self):
         """
@@ -129,14 +114,40 @@ class Move:
         """
         return f"{self.from_x}-{self.from_y} -> {self.to_x}-{self.to_y}"
 
-    def __eq__(self, other):
+
+class MoveRecord:
+    """
+    Represents a move applied to a board, with everything needed to undo it.
+
+    Attributes:
+        move (Move): The move that was applied.
+        piece_type (PieceType): The type of the moved piece.
+        captured (list[tuple[Point, PieceType]]): The cells of the killed pieces and their types.
+    """
+
+    __slots__ = ("move", "piece_type", "captured")
+
+    def __init__(
+        self, move: Move, piece_type: PieceType, captured: list[tuple[Point, PieceType]]
+    ):
         """
-        Check if two Move objects are equal.
+        Initialize a MoveRecord object.
 
         Args:
-            other (Move): The other Move object to compare with.
+            move (Move): The move that was applied.
+            piece_type (PieceType): The type of the moved piece.
+            captured (list[tuple[Point, PieceType]]): The cells of the killed pieces and their types.
+        """
+        self.move = move
+        self.piece_type = piece_type
+        self.captured = captured
+
+    @property
+    def has_killed_piece(self) -> bool:
+        """
+        Check if a piece was killed during the move.
 
         Returns:
-            bool: True if the two Move objects are equal, False otherwise.
+            bool: True if at least one piece was killed, False otherwise.
         """
-        return isinstance(other, Move) and vars(self) == vars(other)
+        return bool(self.captured)
@@ -0,0 +1,384 @@
+import random
+
+from checkers.board import Board
+from checkers.engine import Engine
+from checkers.rules import Move, SideType
+from checkers.transposition import BoundType, TranspositionTable
+from checkers.constants import MAX_PREDICTION_DEPTH, PREDICTION_TIME_LIMIT
+from math import inf
+from time import perf_counter
+from typing import Optional
+
+# score of a won position (reduced by the number of plies needed to win)
+WIN_SCORE = 1000
+# scores this close to WIN_SCORE are wins or losses
+MAX_WIN_DISTANCE = 500
+
+# number of searched nodes between two time budget checks
+TIME_CHECK_INTERVAL = 256
+
+# hash key toggled when black is to move
+BLACK_TO_MOVE_KEY = random.Random(0).getrandbits(64)
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget is exhausted."""
+
+
+class SearchResult:
+    """
+    Represents the result of a search.
+
+    Attributes:
+        moves (list[Move]): The moves of the best turn, empty if there are no valid moves.
+        score (float): The score of the best turn from the point of view of the searching side.
+        depth (int): The depth of the last completed iteration.
+        nodes (int): The number of nodes searched in all iterations.
+        principal_variation (list[list[Move]]): The expected sequence of turns of both sides.
+        elapsed (float): The time spent searching (in seconds).
+    """
+
+    def __init__(
+        self,
+        moves: list[Move],
+        score: float,
+        depth: int,
+        nodes: int,
+        principal_variation: list[list[Move]],
+        elapsed: float,
+    ):
+        """
+        Initialize a SearchResult object.
+
+        Args:
+            moves (list[Move]): The moves of the best turn.
+            score (float): The score of the best turn.
+            depth (int): The depth of the last completed iteration.
+            nodes (int): The number of nodes searched.
+            principal_variation (list[list[Move]]): The expected sequence of turns.
+            elapsed (float): The time spent searching (in seconds).
+        """
+        self.moves = moves
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.principal_variation = principal_variation
+        self.elapsed = elapsed
+
+    def __str__(self):
+        """
+        Returns a string representation of the object.
+
+        Returns:
+            str: The depth, score, node count and principal variation of the search.
+        """
+        principal_variation = " | ".join(
+            ", ".join(str(move) for move in turn) for turn in self.principal_variation
+        )
+        return (
+            f"depth {self.depth} | score {self.score} | nodes {self.nodes} | "
+            f"time {self.elapsed:.3f}s | pv {principal_variation}"
+        )
+
+
+class Search:
+    """
+    Negamax search with alpha-beta pruning and iterative deepening.
+
+    A whole turn, including a sequence of jumps, counts as a single ply.
+    Searched positions are kept in a transposition table, which is reused
+    by the next iterations and by the following searches.
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = PREDICTION_TIME_LIMIT,
+        max_depth: int = MAX_PREDICTION_DEPTH,
+        transposition_table: Optional[TranspositionTable] = None,
+    ):
+        """
+        Initializes a new instance of the Search class.
+
+        Args:
+            time_limit (float, optional): The time budget per search (in seconds), None for no limit.
+                Defaults to PREDICTION_TIME_LIMIT.
+            max_depth (int, optional): The maximum depth (in turns). Defaults to MAX_PREDICTION_DEPTH.
+            transposition_table (TranspositionTable, optional): The table of searched positions.
+                Defaults to a new table.
+        """
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        if transposition_table is None:
+            transposition_table = TranspositionTable()
+        self.transposition_table = transposition_table
+
+    def search(self, board: Board, side: SideType) -> SearchResult:
+        """Search the best turn for the given side.
+
+        The depth is increased until the time budget or the maximum depth is reached.
+        The result of the last completed iteration is returned; the first iteration
+        always completes.
+
+        Args:
+            board (Board): The board to search on. It is not modified.
+            side (SideType): The side to move.
+
+        Returns:
+            SearchResult: The result of the search.
+        """
+        start_time = perf_counter()
+        engine = Engine(Board.copy(board), side)
+
+        self.__nodes = 0
+        self.__deadline = None
+        self.transposition_table.new_search()
+
+        turns_list = engine.get_turns_list(side)
+        # shuffle to pick randomly between equally good turns
+        random.shuffle(turns_list)
+
+        # search the best turn of a previous search first
+        entry = self.transposition_table.probe(self.position_key(engine.board, side))
+        if entry is not None and entry.best_turn in turns_list:
+            turns_list.remove(entry.best_turn)
+            turns_list.insert(0, entry.best_turn)
+
+        result = SearchResult([], -WIN_SCORE, 0, 0, [], 0.0)
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, principal_variation = self.__search_root(
+                    engine, side, depth, turns_list
+                )
+            except SearchTimeout:
+                break
+
+            result = SearchResult(
+                principal_variation[0] if principal_variation else [],
+                score,
+                depth,
+                self.__nodes,
+                principal_variation,
+                perf_counter() - start_time,
+            )
+
+            # stop if there is nothing to choose or the outcome is already known
+            if len(turns_list) <= 1 or abs(score) >= WIN_SCORE - MAX_WIN_DISTANCE:
+                break
+
+            # the first iteration always completes, the next ones are bounded in time
+            if self.time_limit is not None:
+                self.__deadline = start_time + self.time_limit
+                if perf_counter() >= self.__deadline:
+                    break
+
+            # search the best turn first in the next iteration
+            turns_list.remove(result.moves)
+            turns_list.insert(0, result.moves)
+
+        result.nodes = self.__nodes
+        result.elapsed = perf_counter() - start_time
+        return result
+
+    def __search_root(
+        self, engine: Engine, side: SideType, depth: int, turns_list: list[list[Move]]
+    ) -> tuple[float, list[list[Move]]]:
+        """Search all turns of the root position to the given depth.
+
+        Args:
+            engine (Engine): The engine holding the root position.
+            side (SideType): The side to move.
+            depth (int): The depth of the iteration.
+            turns_list (list[list[Move]]): The turns of the root position, in search order.
+
+        Returns:
+            tuple[float, list[list[Move]]]: The best score and the principal variation.
+        """
+        self.__nodes += 1
+        best_score = -inf
+        best_variation = []
+
+        for turn in turns_list:
+            records = engine.make_turn(turn)
+            score, variation = self.__negamax(
+                engine, SideType.opposite(side), depth - 1, -inf, -best_score, 1
+            )
+            engine.undo_turn(records)
+
+            if -score > best_score:
+                best_score = -score
+                best_variation = [turn] + variation
+
+        if not (turns_list):
+            best_score = -WIN_SCORE
+        else:
+            self.transposition_table.store(
+                self.position_key(engine.board, side),
+                depth,
+                BoundType.EXACT,
+                best_score,
+                best_variation[0],
+            )
+
+        return best_score, best_variation
+
+    def __negamax(
+        self,
+        engine: Engine,
+        side: SideType,
+        depth: int,
+        alpha: float,
+        beta: float,
+        ply: int,
+    ) -> tuple[float, list[list[Move]]]:
+        """Search the position with negamax and alpha-beta pruning.
+
+        Args:
+            engine (Engine): The engine holding the position.
+            side (SideType): The side to move.
+            depth (int): The remaining depth.
+            alpha (float): The lower bound of the search window.
+            beta (float): The upper bound of the search window.
+            ply (int): The distance from the root position.
+
+        Returns:
+            tuple[float, list[list[Move]]]: The score for the side to move and the principal variation.
+        """
+        self.__nodes += 1
+        if (
+            self.__deadline is not None
+            and self.__nodes % TIME_CHECK_INTERVAL == 0
+            and perf_counter() >= self.__deadline
+        ):
+            raise SearchTimeout()
+
+        key = None
+        best_turn = []
+        if depth > 0:
+            key = self.position_key(engine.board, side)
+            entry = self.transposition_table.probe(key)
+            if entry is not None:
+                best_turn = entry.best_turn
+                if entry.depth >= depth:
+                    score = score_from_table(entry.score, ply)
+                    if entry.bound == BoundType.EXACT:
+                        return score, [best_turn] if best_turn else []
+                    if entry.bound == BoundType.LOWER:
+                        alpha = max(alpha, score)
+                    elif entry.bound == BoundType.UPPER:
+                        beta = min(beta, score)
+                    if alpha >= beta:
+                        return score, [best_turn] if best_turn else []
+
+        turns_list = engine.get_turns_list(side)
+
+        # the side without valid moves loses, the sooner the worse
+        if not (turns_list):
+            return -WIN_SCORE + ply, []
+
+        if depth <= 0:
+            return self.evaluate(engine.board, side), []
+
+        # search the best turn of a previous search first
+        if best_turn in turns_list:
+            turns_list.remove(best_turn)
+            turns_list.insert(0, best_turn)
+
+        original_alpha = alpha
+        best_score = -inf
+        best_variation = []
+
+        for turn in turns_list:
+            records = engine.make_turn(turn)
+            score, variation = self.__negamax(
+                engine, SideType.opposite(side), depth - 1, -beta, -alpha, ply + 1
+            )
+            engine.undo_turn(records)
+            score = -score
+
+            if score > best_score:
+                best_score = score
+                best_variation = [turn] + variation
+
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = BoundType.UPPER
+        elif best_score >= beta:
+            bound = BoundType.LOWER
+        else:
+            bound = BoundType.EXACT
+
+        self.transposition_table.store(
+            key, depth, bound, score_to_table(best_score, ply), best_variation[0]
+        )
+
+        return best_score, best_variation
+
+    @staticmethod
+    def position_key(board: Board, side: SideType) -> int:
+        """Get the hash key of the position including the side to move.
+
+        Args:
+            board (Board): The board of the position.
+            side (SideType): The side to move.
+
+        Returns:
+            int: The hash key of the position.
+        """
+        if side == SideType.BLACK:
+            return board.hash_key ^ BLACK_TO_MOVE_KEY
+        return board.hash_key
+
+    @staticmethod
+    def evaluate(board: Board, side: SideType) -> float:
+        """Evaluate the position from the point of view of the given side.
+
+        Args:
+            board (Board): The board to evaluate.
+            side (SideType): The side to evaluate for.
+
+        Returns:
+            float: The material balance of the side.
+        """
+        score = board.white_score - board.black_score
+        return score if side == SideType.WHITE else -score
+
+
+def score_to_table(score: float, ply: int) -> float:
+    """Convert a score to be stored in the transposition table.
+
+    Win and loss scores depend on the distance from the root, so they are
+    stored relative to the position instead.
+
+    Args:
+        score (float): The score relative to the root.
+        ply (int): The distance of the position from the root.
+
+    Returns:
+        float: The score relative to the position.
+    """
+    if score >= WIN_SCORE - MAX_WIN_DISTANCE:
+        return score + ply
+    if score <= -WIN_SCORE + MAX_WIN_DISTANCE:
+        return score - ply
+    return score
+
+
+def score_from_table(score: float, ply: int) -> float:
+    """Convert a score read from the transposition table.
+
+    Args:
+        score (float): The score relative to the position.
+        ply (int): The distance of the position from the root.
+
+    Returns:
+        float: The score relative to the root.
+    """
+    if score >= WIN_SCORE - MAX_WIN_DISTANCE:
+        return score - ply
+    if score <= -WIN_SCORE + MAX_WIN_DISTANCE:
+        return score + ply
+    return score
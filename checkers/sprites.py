@@ -0,0 +1,59 @@
+from checkers.rules import PieceType
+from checkers.constants import ASSETS_PATH, PIECE_SPRITES, HIGHLIGHT_BRIGHTNESS
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # PIL is imported with the first sprite, after the window shows up
+    from PIL import Image, ImageTk
+
+
+@lru_cache(maxsize=None)
+def get_sprite(
+    piece_type: PieceType, cell_size: int, highlighted: bool = False
+) -> "ImageTk.PhotoImage":
+    """Get the image of a piece type scaled to a cell size.
+
+    Sprites are loaded on first use and cached for the whole process, so new
+    games and renderers don't decode or scale images again. A Tk root window
+    must exist before the first call.
+
+    Args:
+        piece_type (PieceType): The type of the piece, with a file in PIECE_SPRITES.
+        cell_size (int): The size of a cell (in pixels).
+        highlighted (bool, optional): True to get a brighter version of the sprite. Defaults to False.
+
+    Returns:
+        ImageTk.PhotoImage: The scaled sprite.
+    """
+    from PIL import ImageEnhance, ImageTk
+
+    image = _load_scaled_image(PIECE_SPRITES[piece_type], cell_size)
+    if highlighted:
+        image = ImageEnhance.Brightness(image).enhance(HIGHLIGHT_BRIGHTNESS)
+    return ImageTk.PhotoImage(image)
+
+
+@lru_cache(maxsize=None)
+def _load_scaled_image(file_name: str, cell_size: int) -> "Image.Image":
+    """Load an asset at the given size.
+
+    An asset drawn for the size, named like `white-piece-75.png` for
+    `white-piece.png`, is used as is. Otherwise the asset is resized.
+
+    Args:
+        file_name (str): The file name of the asset.
+        cell_size (int): The size of the image (in pixels).
+
+    Returns:
+        Image.Image: The decoded image of the requested size.
+    """
+    from PIL import Image
+
+    path = Path(ASSETS_PATH, file_name)
+    sized_path = path.with_name(f"{path.stem}-{cell_size}{path.suffix}")
+    if sized_path.exists():
+        return Image.open(sized_path).convert("RGBA")
+
+    return Image.open(path).convert("RGBA").resize((cell_size, cell_size))
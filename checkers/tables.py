@@ -0,0 +1,97 @@
+from checkers.rules import SideType
+from checkers.constants import MOVE_OFFSETS
+from functools import lru_cache
+from typing import Optional
+
+
+class MoveTables:
+    """
+    Lookup tables of a board geometry used for move generation.
+
+    Cells are indexed as `y * x_size + x`, like the bits of the board masks.
+    Directions are indexed like MOVE_OFFSETS.
+
+    Attributes:
+        shifts (list[int]): The change of the cell index for one step in each direction.
+        step_sources (list[int]): Per direction, the mask of cells that can step in that direction.
+        jump_sources (list[int]): Per direction, the mask of cells that can jump in that direction.
+        forward_directions (dict[SideType, list[int]]): The directions each side moves in.
+    """
+
+    def __init__(self, x_size: int, y_size: int):
+        """
+        Initializes the tables of the given board geometry.
+
+        Args:
+            x_size (int): The size of the board along the x-axis.
+            y_size (int): The size of the board along the y-axis.
+        """
+        self.shifts = []
+        self.step_sources = []
+        self.jump_sources = []
+
+        def index_at(x: int, y: int) -> Optional[int]:
+            if 0 <= x < x_size and 0 <= y < y_size:
+                return y * x_size + x
+            return None
+
+        for offset in MOVE_OFFSETS:
+            self.shifts.append(offset.y * x_size + offset.x)
+
+            step_sources = 0
+            jump_sources = 0
+
+            for y in range(y_size):
+                for x in range(x_size):
+                    neighbor = index_at(x + offset.x, y + offset.y)
+                    landing = index_at(x + offset.x * 2, y + offset.y * 2)
+
+                    if neighbor is not None:
+                        step_sources |= 1 << (y * x_size + x)
+                    if landing is not None:
+                        jump_sources |= 1 << (y * x_size + x)
+
+            self.step_sources.append(step_sources)
+            self.jump_sources.append(jump_sources)
+
+        self.forward_directions = {
+            SideType.WHITE: [
+                direction
+                for direction, offset in enumerate(MOVE_OFFSETS)
+                if offset.y < 0
+            ],
+            SideType.BLACK: [
+                direction
+                for direction, offset in enumerate(MOVE_OFFSETS)
+                if offset.y > 0
+            ],
+        }
+
+
+@lru_cache(maxsize=None)
+def get_move_tables(x_size: int, y_size: int) -> MoveTables:
+    """
+    Get the move tables of a board geometry, computing them on first use.
+
+    Args:
+        x_size (int): The size of the board along the x-axis.
+        y_size (int): The size of the board along the y-axis.
+
+    Returns:
+        MoveTables: The move tables of the geometry.
+    """
+    return MoveTables(x_size, y_size)
+
+
+def shift_mask(mask: int, shift: int) -> int:
+    """
+    Shift all cells of a mask by the given index difference.
+
+    Args:
+        mask (int): The mask to shift.
+        shift (int): The change of the cell index, may be negative.
+
+    Returns:
+        int: The shifted mask.
+    """
+    return mask << shift if shift >= 0 else mask >> -shift
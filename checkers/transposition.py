@@ -0,0 +1,141 @@
+from checkers.rules import Move
+from checkers.constants import TRANSPOSITION_TABLE_SIZE
+from enum import Enum
+from typing import Optional
+
+
+class BoundType(Enum):
+    """
+    Enum representing how a stored score bounds the real score of a position.
+
+    Attributes:
+        EXACT: The stored score is the real score.
+        LOWER: The real score is at least the stored score (the search failed high).
+        UPPER: The real score is at most the stored score (the search failed low).
+    """
+
+    EXACT = 1
+    LOWER = 2
+    UPPER = 3
+
+
+class TranspositionEntry:
+    """
+    Represents a searched position stored in the transposition table.
+
+    Attributes:
+        key (int): The hash key of the position.
+        depth (int): The depth the position was searched to.
+        bound (BoundType): How the score bounds the real score.
+        score (float): The score of the position for the side to move.
+        best_turn (list[Move]): The best turn found, empty if there is none.
+        generation (int): The search the entry was stored in.
+    """
+
+    __slots__ = ("key", "depth", "bound", "score", "best_turn", "generation")
+
+    def __init__(
+        self,
+        key: int,
+        depth: int,
+        bound: BoundType,
+        score: float,
+        best_turn: list[Move],
+        generation: int,
+    ):
+        """
+        Initialize a TranspositionEntry object.
+
+        Args:
+            key (int): The hash key of the position.
+            depth (int): The depth the position was searched to.
+            bound (BoundType): How the score bounds the real score.
+            score (float): The score of the position for the side to move.
+            best_turn (list[Move]): The best turn found.
+            generation (int): The search the entry was stored in.
+        """
+        self.key = key
+        self.depth = depth
+        self.bound = bound
+        self.score = score
+        self.best_turn = best_turn
+        self.generation = generation
+
+
+class TranspositionTable:
+    """
+    Fixed-size table of searched positions indexed by their hash key.
+
+    When two positions share a slot, the entry from an older search or the
+    shallower entry is replaced.
+    """
+
+    def __init__(self, size: int = TRANSPOSITION_TABLE_SIZE):
+        """
+        Initializes a new instance of the TranspositionTable class.
+
+        Args:
+            size (int, optional): The number of slots. Defaults to TRANSPOSITION_TABLE_SIZE.
+        """
+        self.__size = size
+        self.__generation = 0
+        self.clear()
+
+    def __len__(self) -> int:
+        """
+        Get the number of stored entries.
+
+        Returns:
+            int: The number of occupied slots.
+        """
+        return self.__size - self.__entries.count(None)
+
+    def clear(self):
+        """Remove all entries from the table."""
+        self.__entries: list[Optional[TranspositionEntry]] = [None] * self.__size
+
+    def new_search(self):
+        """Start a new search, so the entries of the previous ones age."""
+        self.__generation += 1
+
+    def probe(self, key: int) -> Optional[TranspositionEntry]:
+        """Look up a position.
+
+        Args:
+            key (int): The hash key of the position.
+
+        Returns:
+            Optional[TranspositionEntry]: The stored entry, or None if the position is not stored.
+        """
+        entry = self.__entries[key % self.__size]
+        if entry is not None and entry.key == key:
+            return entry
+        return None
+
+    def store(
+        self, key: int, depth: int, bound: BoundType, score: float, best_turn: list[Move]
+    ):
+        """Store a searched position.
+
+        Args:
+            key (int): The hash key of the position.
+            depth (int): The depth the position was searched to.
+            bound (BoundType): How the score bounds the real score.
+            score (float): The score of the position for the side to move.
+            best_turn (list[Move]): The best turn found.
+        """
+        index = key % self.__size
+        entry = self.__entries[index]
+
+        # keep deeper entries of the current search for other positions
+        if (
+            entry is not None
+            and entry.key != key
+            and entry.generation == self.__generation
+            and entry.depth > depth
+        ):
+            return
+
+        self.__entries[index] = TranspositionEntry(
+            key, depth, bound, score, best_turn, self.__generation
+        )
@@ -1,9 +1,17 @@
+import time
+
+# taken before the other imports, so the startup time includes them
+START_TIME = time.perf_counter()
+
+import logging
 from tkinter import Tk, Canvas, PhotoImage
 from checkers.game import Game
 from checkers.constants import X_SIZE, Y_SIZE, CELL_SIZE
 
 
 def main():
+    imports_time = time.perf_counter()
+
     # main window
     main_window = Tk()
     main_window.title("American Checkers")
@@ -16,11 +24,36 @@ def main():
     )
     main_canvas.pack()
 
+    window_time = time.perf_counter()
     game = Game(main_canvas, X_SIZE, Y_SIZE)
+    game_time = time.perf_counter()
 
     main_canvas.bind("<Motion>", game.mouse_move)
     main_canvas.bind("<Button-1>", game.mouse_down)
 
+    def on_close():
+        # keep what was learned during the session, the window closes even if saving fails
+        try:
+            game.save_checkpoint()
+        finally:
+            main_window.destroy()
+
+    main_window.protocol("WM_DELETE_WINDOW", on_close)
+
+    def report_startup():
+        # the window is drawn by the idle tasks queued before this one
+        first_frame_time = time.perf_counter()
+        report = (
+            f"Startup: imports {imports_time - START_TIME:.3f}s | "
+            f"window {window_time - imports_time:.3f}s | "
+            f"game {game_time - window_time:.3f}s | "
+            f"first frame {first_frame_time - START_TIME:.3f}s"
+        )
+        print(report)
+        logging.info(report)
+
+    main_window.after_idle(report_startup)
+
     main_window.mainloop()
 
 
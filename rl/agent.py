@@ -0,0 +1,214 @@
+import copy
+import logging
+import numpy as np
+import torch
+import torch.optim as optim
+
+from checkers.actions import ActionSpace
+from checkers.board import Board
+from checkers.encoding import encode_board, get_encoding_size
+from checkers.engine import Engine
+from checkers.rules import Move, SideType
+from checkers.constants import (
+    LEARNING_RATE,
+    BATCH_SIZE,
+    GAMMA,
+    REPLAY_BUFFER_SIZE,
+    TARGET_UPDATE_INTERVAL,
+    TARGET_UPDATE_TAU,
+    INFERENCE_THREADS,
+    QUANTIZE_INFERENCE,
+    CHECKPOINT_PATH,
+    POLICY_PATH,
+)
+from rl.checkpoint import export_policy, load_checkpoint, save_checkpoint
+from rl.dqn import (
+    DQN,
+    ReplayBuffer,
+    select_actions,
+    train_dqn,
+    update_target_dqn,
+)
+from rl.experience import Experience
+from rl.inference import quantize_dqn, set_inference_threads
+from pathlib import Path
+
+
+class DQNAgent:
+    """
+    The DQN of the game with its training state.
+
+    Everything that needs torch lives here, so the game only imports this
+    module when the DQN is needed.
+    """
+
+    def __init__(self, x_size: int, y_size: int):
+        """
+        Initializes the DQN, warm-started from the checkpoint if there is one.
+
+        Args:
+            x_size (int): The number of columns of the board.
+            y_size (int): The number of rows of the board.
+        """
+        set_inference_threads(INFERENCE_THREADS)
+
+        self.__action_space = ActionSpace(x_size, y_size)
+        self.__input_size = get_encoding_size(x_size, y_size)
+        self.__init_training_state()
+
+        # warm start from the previous sessions
+        self.__load_checkpoint()
+
+    def __init_training_state(self):
+        """Create a new DQN, its target network, the optimizer and the replay buffer."""
+        self.dqn = DQN(self.__input_size, self.__action_space.size)
+        self.target_dqn = copy.deepcopy(self.dqn)
+        self.__train_steps = 0
+        self.optimizer = optim.Adam(self.dqn.parameters(), lr=LEARNING_RATE)
+        self.replay_buffer = ReplayBuffer(REPLAY_BUFFER_SIZE)
+
+    def __load_checkpoint(self):
+        """Restore the DQN, the optimizer and the replay buffer from the checkpoint, if any.
+
+        A checkpoint that can't be loaded, e.g. an older version or a corrupt
+        file, is ignored and the training starts over.
+        """
+        if not (Path(CHECKPOINT_PATH).exists()):
+            return
+
+        try:
+            self.__train_steps = load_checkpoint(
+                CHECKPOINT_PATH,
+                self.dqn,
+                self.optimizer,
+                self.replay_buffer,
+                self.target_dqn,
+            )
+            logging.info(f"Loaded checkpoint {CHECKPOINT_PATH}")
+        except Exception as error:
+            logging.warning(f"Ignored checkpoint {CHECKPOINT_PATH}: {error!r}")
+            # the checkpoint may have been partially loaded
+            self.__init_training_state()
+
+    def save_checkpoint(self):
+        """Save the DQN, the optimizer and the replay buffer, and export the policy for inference."""
+        save_checkpoint(
+            CHECKPOINT_PATH,
+            self.dqn,
+            self.optimizer,
+            self.replay_buffer,
+            self.target_dqn,
+            self.__train_steps,
+        )
+        export_policy(
+            POLICY_PATH, quantize_dqn(self.dqn) if QUANTIZE_INFERENCE else self.dqn
+        )
+        logging.info(f"Saved checkpoint {CHECKPOINT_PATH}")
+
+    def remember(
+        self,
+        state: np.ndarray,
+        move: Move,
+        reward: float,
+        next_state: np.ndarray,
+        done: bool,
+        next_moves_list: list[Move],
+        same_side: bool,
+    ):
+        """Add a move to the replay buffer.
+
+        Args:
+            state (np.ndarray): The encoded state before the move.
+            move (Move): The move.
+            reward (float): The reward of the move.
+            next_state (np.ndarray): The encoded state after the move.
+            done (bool): True if the game is over after the move.
+            next_moves_list (list[Move]): The legal moves after the move.
+            same_side (bool): True if the same side moves again after the move.
+        """
+        # convert the experience to tensors, the cached states are only copied
+        experience = Experience(
+            torch.tensor(state).unsqueeze(0),
+            torch.tensor([self.__action_space.encode(move)], dtype=torch.long),
+            torch.tensor([reward], dtype=torch.float32),
+            torch.tensor(next_state).unsqueeze(0),
+            torch.tensor([done], dtype=torch.float32),
+            torch.tensor(
+                [self.__action_space.get_legal_mask(next_moves_list)], dtype=torch.bool
+            ),
+            torch.tensor([same_side], dtype=torch.float32),
+        )
+        self.replay_buffer.push(experience)
+
+    def train(self):
+        """Train the DQN using the replay buffer"""
+        train_dqn(
+            self.dqn,
+            self.replay_buffer,
+            BATCH_SIZE,
+            GAMMA,
+            self.optimizer,
+            self.target_dqn,
+        )
+
+        # update the target network on a fixed cadence
+        self.__train_steps += 1
+        if self.__train_steps % TARGET_UPDATE_INTERVAL == 0:
+            update_target_dqn(self.target_dqn, self.dqn, TARGET_UPDATE_TAU)
+
+    def predict_moves(self, board: Board, side: SideType) -> list[Move]:
+        """Predict the moves of a turn with the DQN.
+
+        Each move is one forward pass of the DQN restricted to the legal moves.
+        The moves are played on a copy of the board to find the next jumps.
+
+        Args:
+            board (Board): The board of the position.
+            side (SideType): The side for which to predict the moves.
+
+        Returns:
+            list[Move]: The moves of the turn.
+        """
+        moves = []
+        engine = Engine(Board.copy(board), side)
+
+        # the DQN is trained after every player turn, so it is quantized again for each turn
+        policy = quantize_dqn(self.dqn) if QUANTIZE_INFERENCE else self.dqn
+
+        moves_list = engine.get_moves_list(side)
+        while moves_list:
+            move = self.__selected_action(policy, engine.board, side, moves_list)
+            record = engine.handle_move(move)
+            moves.append(move)
+
+            # check if the piece can move again
+            if not (record.has_killed_piece):
+                break
+            moves_list = engine.get_continuation_moves_list(move, side)
+
+        return moves
+
+    def __selected_action(
+        self,
+        policy: torch.nn.Module,
+        board: Board,
+        side: SideType,
+        moves_list: list[Move],
+    ) -> Move:
+        """Select the legal move with the highest Q-value for the given state.
+
+        Args:
+            policy (torch.nn.Module): The DQN, or its quantized copy.
+            board (Board): The board of the state.
+            side (SideType): The side to move.
+            moves_list (list[Move]): The legal moves.
+
+        Returns:
+            Move: The selected move.
+        """
+        state = torch.tensor(encode_board(board, side)).unsqueeze(0)
+        mask = np.array([self.__action_space.get_legal_mask(moves_list)])
+
+        # the AI plays greedily, the exploration comes from the moves of the player
+        action = int(select_actions(policy, state, mask, 0.0)[0])
+        return self.__action_space.decode(action)
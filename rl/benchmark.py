@@ -0,0 +1,139 @@
+import argparse
+import time
+import numpy as np
+import torch
+
+from checkers.constants import X_SIZE, Y_SIZE, INFERENCE_THREADS
+from rl.checkpoint import load_checkpoint
+from rl.dqn import DQN
+from rl.env import CheckersEnv
+from rl.inference import quantize_dqn, set_inference_threads
+from typing import Optional
+
+
+def sample_positions(
+    count: int, x_size: int = X_SIZE, y_size: int = Y_SIZE, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collect positions of random self-play games.
+
+    Args:
+        count (int): The number of positions.
+        x_size (int, optional): The size of the boards along the x-axis. Defaults to X_SIZE.
+        y_size (int, optional): The size of the boards along the y-axis. Defaults to Y_SIZE.
+        seed (int, optional): The seed of the random moves. Defaults to 0.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The encoded positions and their legal action masks.
+    """
+    generator = np.random.default_rng(seed)
+    env = CheckersEnv(min(count, 64), x_size, y_size)
+
+    observations, masks = env.reset()
+    all_observations = [observations]
+    all_masks = [masks]
+    while sum(len(batch) for batch in all_observations) < count:
+        # a random legal action of every game
+        actions = np.argmax(np.where(masks, generator.random(masks.shape), -1), axis=1)
+        observations, _, dones, masks = env.step(actions)
+        if dones.any():
+            observations, masks = env.reset(dones)
+        all_observations.append(observations)
+        all_masks.append(masks)
+
+    return (
+        np.concatenate(all_observations)[:count],
+        np.concatenate(all_masks)[:count],
+    )
+
+
+def measure(dqn: torch.nn.Module, states: torch.Tensor, batch_size: int) -> float:
+    """
+    Measure the time to evaluate states by batches.
+
+    Args:
+        dqn (torch.nn.Module): The model to evaluate.
+        states (torch.Tensor): The states.
+        batch_size (int): The number of states of a forward pass.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    with torch.no_grad():
+        # warm up the allocator and the kernels
+        dqn(states[:batch_size])
+
+        start_time = time.perf_counter()
+        for start in range(0, len(states), batch_size):
+            dqn(states[start : start + batch_size])
+        return time.perf_counter() - start_time
+
+
+def run_benchmark(
+    positions_count: int = 4096,
+    batch_size: int = 256,
+    num_threads: int = INFERENCE_THREADS,
+    dqn: Optional[DQN] = None,
+):
+    """
+    Compare the latency and the throughput of the float and the int8 DQN.
+
+    Both models evaluate the same positions of random games. The latency is
+    measured one position at a time, as a game does for a move, and the
+    throughput by batches, as the inference server does.
+
+    Args:
+        positions_count (int, optional): The number of positions. Defaults to 4096.
+        batch_size (int, optional): The number of positions of a batch. Defaults to 256.
+        num_threads (int, optional): The number of torch threads. Defaults to INFERENCE_THREADS.
+        dqn (DQN, optional): The model to benchmark. Defaults to a new model.
+    """
+    set_inference_threads(num_threads)
+
+    observations, masks = sample_positions(positions_count)
+    states = torch.as_tensor(observations)
+
+    if dqn is None:
+        dqn = DQN(states.shape[1], masks.shape[1])
+    dqn.eval()
+    models = {"float32": dqn, "int8": quantize_dqn(dqn)}
+
+    print(
+        f"{len(states)} positions | {torch.get_num_threads()} threads | "
+        f"batches of {batch_size}"
+    )
+    for name, model in models.items():
+        latency = measure(model, states, 1) / len(states)
+        throughput = len(states) / measure(model, states, batch_size)
+        print(
+            f"{name:>8} | {latency * 1e6:8.1f} us/position | "
+            f"{throughput:10.0f} positions/s"
+        )
+
+    # check the quantized model still picks the same moves
+    with torch.no_grad():
+        q_values = [model(states).numpy() for model in models.values()]
+    actions = [np.argmax(np.where(masks, q, -np.inf), axis=1) for q in q_values]
+    print(
+        f"max |ΔQ| {np.abs(q_values[0] - q_values[1]).max():.4f} | "
+        f"same action {np.mean(actions[0] == actions[1]):.1%}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the float and the int8 DQN on the same positions."
+    )
+    parser.add_argument("--positions", type=int, default=4096)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--threads", type=int, default=INFERENCE_THREADS)
+    parser.add_argument("--checkpoint", help="load the DQN of a checkpoint")
+    arguments = parser.parse_args()
+
+    dqn = None
+    if arguments.checkpoint:
+        env = CheckersEnv(1)
+        dqn = DQN(env.observation_size, env.action_size)
+        load_checkpoint(arguments.checkpoint, dqn)
+
+    run_benchmark(arguments.positions, arguments.batch_size, arguments.threads, dqn)
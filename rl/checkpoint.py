@@ -0,0 +1,144 @@
+import os
+import torch
+
+from pathlib import Path
+from typing import Optional, Union
+
+# version of the checkpoint format, increased on incompatible changes
+CHECKPOINT_VERSION = 2
+
+
+def save_checkpoint(
+    path: Union[str, Path],
+    dqn,
+    optimizer=None,
+    replay_buffer=None,
+    target_dqn=None,
+    train_steps: int = 0,
+):
+    """
+    Save the training state to a checkpoint file.
+
+    The file is written next to the destination first and then renamed, so an
+    interrupted save never corrupts an existing checkpoint.
+
+    Args:
+        path (Union[str, Path]): The path of the checkpoint file.
+        dqn (DQN): The trained model.
+        optimizer (torch.optim.Optimizer, optional): The optimizer of the model. Defaults to None.
+        replay_buffer (ReplayBuffer, optional): The replay buffer. Defaults to None.
+        target_dqn (DQN, optional): The target network. Defaults to None.
+        train_steps (int, optional): The number of training steps done. Defaults to 0.
+    """
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "input_size": dqn.fc.in_features,
+        "output_size": dqn.fc2.out_features,
+        "train_steps": train_steps,
+        "dqn": dqn.state_dict(),
+    }
+    if target_dqn is not None:
+        checkpoint["target_dqn"] = target_dqn.state_dict()
+    if optimizer is not None:
+        checkpoint["optimizer"] = optimizer.state_dict()
+    if replay_buffer is not None:
+        checkpoint["replay_buffer"] = replay_buffer.state_dict()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(path.name + ".tmp")
+    torch.save(checkpoint, temporary_path)
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(
+    path: Union[str, Path],
+    dqn,
+    optimizer=None,
+    replay_buffer=None,
+    target_dqn=None,
+) -> int:
+    """
+    Restore the training state from a checkpoint file.
+
+    The given objects are updated in place. The parts that were not saved in
+    the checkpoint are left unchanged.
+
+    Args:
+        path (Union[str, Path]): The path of the checkpoint file.
+        dqn (DQN): The model to restore.
+        optimizer (torch.optim.Optimizer, optional): The optimizer to restore. Defaults to None.
+        replay_buffer (ReplayBuffer, optional): The replay buffer to restore. Defaults to None.
+        target_dqn (DQN, optional): The target network to restore. Defaults to None.
+
+    Returns:
+        int: The number of training steps done when the checkpoint was saved.
+
+    Raises:
+        ValueError: If the checkpoint has another version or was saved for a model of another size.
+    """
+    checkpoint = torch.load(path, weights_only=True)
+
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Unsupported checkpoint version {checkpoint.get('version')}, "
+            f"expected {CHECKPOINT_VERSION}"
+        )
+    if (checkpoint["input_size"], checkpoint["output_size"]) != (
+        dqn.fc.in_features,
+        dqn.fc2.out_features,
+    ):
+        raise ValueError(
+            f"Checkpoint saved for a model of size "
+            f"{checkpoint['input_size']}x{checkpoint['output_size']}, "
+            f"not {dqn.fc.in_features}x{dqn.fc2.out_features}"
+        )
+
+    dqn.load_state_dict(checkpoint["dqn"])
+    if target_dqn is not None:
+        target_dqn.load_state_dict(checkpoint.get("target_dqn", checkpoint["dqn"]))
+    if optimizer is not None and "optimizer" in checkpoint:
+        optimizer.load_state_dict(checkpoint["optimizer"])
+    if replay_buffer is not None and "replay_buffer" in checkpoint:
+        replay_buffer.load_state_dict(checkpoint["replay_buffer"])
+
+    return checkpoint["train_steps"]
+
+
+def export_policy(
+    path: Union[str, Path], dqn, example_input: Optional[torch.Tensor] = None
+):
+    """
+    Export a model as a TorchScript inference artifact.
+
+    Args:
+        path (Union[str, Path]): The path of the exported file.
+        dqn (torch.nn.Module): The model to export.
+        example_input (torch.Tensor, optional): An input used to trace the model instead of
+            scripting it. Defaults to None.
+    """
+    with torch.no_grad():
+        if example_input is None:
+            policy = torch.jit.script(dqn)
+        else:
+            policy = torch.jit.trace(dqn, example_input)
+    policy.eval()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    torch.jit.save(policy, str(path))
+
+
+def load_policy(path: Union[str, Path]) -> torch.jit.ScriptModule:
+    """
+    Load an exported inference artifact.
+
+    Only torch is needed, not the training code.
+
+    Args:
+        path (Union[str, Path]): The path of the exported file.
+
+    Returns:
+        torch.jit.ScriptModule: The model, in evaluation mode.
+    """
+    return torch.jit.load(str(path)).eval()
@@ -1,7 +1,9 @@
+import numpy as np
 import torch
 import torch.nn as nn
-import random
 from rl.experience import Experience
+from math import inf
+from checkers.constants import PRIORITY_ALPHA, PRIORITY_BETA, PRIORITY_EPSILON
 
 
 class DQN(nn.Module):
@@ -32,41 +34,159 @@ class DQN(nn.Module):
         return x
 
 
+def select_actions(dqn, states, masks, epsilon, generator=None):
+    """
+    Selects an epsilon-greedy legal action for each state of a batch.
+
+    Args:
+        dqn (torch.nn.Module): The DQN model giving the Q-values.
+        states (Union[np.ndarray, torch.Tensor]): The batch of states.
+        masks (np.ndarray): The legal action masks of the states.
+        epsilon (float): The probability of selecting a random legal action.
+        generator (np.random.Generator, optional): The random generator. Defaults to a new one.
+
+    Returns:
+        np.ndarray: The index of the selected action of each state.
+    """
+    generator = generator or np.random.default_rng()
+
+    with torch.no_grad():
+        q_values = dqn(torch.as_tensor(states, dtype=torch.float32)).numpy()
+
+    # random legal actions get a random score, the other ones their Q-value
+    explore = generator.random(len(states)) < epsilon
+    scores = np.where(explore[:, None], generator.random(q_values.shape), q_values)
+
+    return np.argmax(np.where(masks, scores, -np.inf), axis=1)
+
+
 class ReplayBuffer:
+    # data types of the stored fields, the other fields are stored as float32
+    FIELD_DTYPES = {"action": torch.long, "next_mask": torch.bool}
+
     def __init__(self, capacity):
         """
         Initialize the ReplayBuffer object.
 
+        The storage is a circular buffer of one preallocated tensor per field
+        of Experience, allocated on the first push when the shapes are known.
+
         Args:
             capacity (int): The maximum capacity of the buffer.
         """
-        self.buffer = []
         self.capacity = capacity
+        self.storage = None
+        self.position = 0
+        self.size = 0
 
     def push(self, experience):
         """
         Add an experience to the buffer.
 
-        If the buffer is already at maximum capacity, the oldest experience will be removed.
+        If the buffer is already at maximum capacity, the oldest experience will be overwritten.
 
         Args:
-            experience (object): The experience to be added to the buffer.
+            experience (Experience): The experience to be added to the buffer.
+
+        Returns:
+            torch.Tensor: The position the experience was stored at.
         """
-        if len(self.buffer) >= self.capacity:
-            self.buffer.pop(0)
-        self.buffer.append(experience)
+        return self.push_batch(
+            Experience(
+                *(
+                    torch.as_tensor(value).reshape(1, -1)
+                    if field in ("state", "next_state", "next_mask")
+                    else torch.as_tensor(value).reshape(1)
+                    for field, value in zip(Experience._fields, experience)
+                )
+            )
+        )
+
+    def push_batch(self, experience):
+        """
+        Add a batch of experiences to the buffer.
+
+        Args:
+            experience (Experience): The experiences, each field holding one row per experience.
+
+        Returns:
+            torch.Tensor: The positions the experiences were stored at.
+        """
+        values = [torch.as_tensor(value) for value in experience]
+        batch_size = len(values[0])
+
+        if self.storage is None:
+            self.storage = [
+                torch.zeros(
+                    (self.capacity, *value.shape[1:]),
+                    dtype=self.FIELD_DTYPES.get(field, torch.float32),
+                )
+                for field, value in zip(Experience._fields, values)
+            ]
+
+        # only the newest experiences are kept if the batch is larger than the buffer
+        if batch_size > self.capacity:
+            values = [value[-self.capacity :] for value in values]
+            batch_size = self.capacity
+
+        indices = (
+            torch.arange(self.position, self.position + batch_size) % self.capacity
+        )
+        for tensor, value in zip(self.storage, values):
+            tensor[indices] = value.to(tensor.dtype)
+
+        self.position = (self.position + batch_size) % self.capacity
+        self.size = min(self.size + batch_size, self.capacity)
+
+        return indices
 
     def sample(self, batch_size):
         """
         Randomly sample experiences from the buffer.
 
+        The experiences are drawn uniformly with replacement.
+
         Args:
             batch_size (int): The number of experiences to sample.
 
         Returns:
-            list: A list of sampled experiences.
+            Experience: The sampled experiences, each field holding a batch tensor.
+        """
+        indices = torch.randint(0, self.size, (batch_size,))
+        return Experience(*(tensor[indices] for tensor in self.storage))
+
+    def state_dict(self):
+        """
+        Get the state of the buffer, to save it in a checkpoint.
+
+        Returns:
+            dict: The stored experiences and the position of the buffer.
+        """
+        return {
+            "capacity": self.capacity,
+            "storage": self.storage,
+            "position": self.position,
+            "size": self.size,
+        }
+
+    def load_state_dict(self, state_dict):
+        """
+        Restore the state of the buffer saved by state_dict.
+
+        Args:
+            state_dict (dict): The state of the buffer.
+
+        Raises:
+            ValueError: If the state was saved by a buffer of another capacity.
         """
-        return random.sample(self.buffer, batch_size)
+        if state_dict["capacity"] != self.capacity:
+            raise ValueError(
+                f"Replay buffer of capacity {state_dict['capacity']}, not {self.capacity}"
+            )
+
+        self.storage = state_dict["storage"]
+        self.position = state_dict["position"]
+        self.size = state_dict["size"]
 
     def __len__(self):
         """
@@ -75,20 +195,222 @@ class ReplayBuffer:
         Returns:
             int: The number of experiences in the buffer.
         """
-        return len(self.buffer)
+        return self.size
+
+
+class SumTree:
+    def __init__(self, capacity):
+        """
+        Initialize the SumTree object.
+
+        The tree is stored in an array: node i has children 2i and 2i + 1, the
+        root is node 1 and the leaves hold the priorities. Every inner node
+        holds the sum of its children, so updates and lookups are O(log n).
+
+        Args:
+            capacity (int): The number of leaves.
+        """
+        self.capacity = capacity
+        self.leaves_count = 1 << max(capacity - 1, 0).bit_length()
+        self.tree = np.zeros(2 * self.leaves_count)
+
+    @property
+    def total(self):
+        """
+        Get the sum of all priorities.
+
+        Returns:
+            float: The value of the root.
+        """
+        return self.tree[1]
+
+    def update(self, indices, priorities):
+        """
+        Set the priorities of the given leaves.
+
+        Args:
+            indices (np.ndarray): The indices of the leaves.
+            priorities (np.ndarray): The new priorities.
+        """
+        nodes = np.asarray(indices) + self.leaves_count
+        self.tree[nodes] = priorities
+
+        # recompute the sums of the ancestors, one level at a time
+        nodes = np.unique(nodes // 2)
+        while nodes[0] > 0:
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+            nodes = np.unique(nodes // 2)
+
+    def find(self, values):
+        """
+        Find the leaves where the given prefix sums of the priorities fall.
 
+        Args:
+            values (np.ndarray): Values between 0 and the total priority.
+
+        Returns:
+            np.ndarray: The index of the leaf of each value.
+        """
+        nodes = np.ones(len(values), dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+
+        while nodes[0] < self.leaves_count:
+            left = 2 * nodes
+            go_right = values >= self.tree[left]
+            values = np.where(go_right, values - self.tree[left], values)
+            nodes = np.where(go_right, left + 1, left)
+
+        return nodes - self.leaves_count
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    def __init__(
+        self,
+        capacity,
+        alpha=PRIORITY_ALPHA,
+        beta=PRIORITY_BETA,
+        epsilon=PRIORITY_EPSILON,
+    ):
+        """
+        Initialize the PrioritizedReplayBuffer object.
+
+        Experiences are sampled with a probability proportional to their
+        priority raised to alpha. New experiences get the highest priority
+        seen so far, and priorities are updated from the TD errors.
+
+        Args:
+            capacity (int): The maximum capacity of the buffer.
+            alpha (float): How much the priorities matter, 0 being uniform sampling.
+            beta (float): How much the importance-sampling weights correct the sampling bias.
+            epsilon (float): The priority added to every TD error, so every experience can be sampled.
+        """
+        super(PrioritizedReplayBuffer, self).__init__(capacity)
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon = epsilon
+        self.max_priority = 1.0
+        self.tree = SumTree(capacity)
+
+    def push_batch(self, experience):
+        """
+        Add a batch of experiences to the buffer with the highest priority.
+
+        Args:
+            experience (Experience): The experiences, each field holding one row per experience.
+
+        Returns:
+            torch.Tensor: The positions the experiences were stored at.
+        """
+        indices = super(PrioritizedReplayBuffer, self).push_batch(experience)
+        self.tree.update(indices.numpy(), self.max_priority**self.alpha)
+        return indices
+
+    def sample(self, batch_size):
+        """
+        Sample experiences according to their priorities.
+
+        The total priority is split into batch_size equal segments and one
+        experience is drawn from each segment.
+
+        Args:
+            batch_size (int): The number of experiences to sample.
+
+        Returns:
+            tuple[Experience, np.ndarray, torch.Tensor]: The sampled experiences, their positions
+                in the buffer and their importance-sampling weights.
+        """
+        segment = self.tree.total / batch_size
+        values = (np.arange(batch_size) + np.random.random(batch_size)) * segment
+        indices = np.minimum(self.tree.find(values), self.size - 1)
 
-def train_dqn(dqn, replay_buffer, batch_size, gamma, optimizer):
+        # importance-sampling weights, normalized so the largest one is 1
+        probabilities = self.tree.tree[indices + self.tree.leaves_count] / self.tree.total
+        weights = (self.size * probabilities) ** -self.beta
+        weights /= weights.max()
+
+        experiences = Experience(*(tensor[indices] for tensor in self.storage))
+        return experiences, indices, torch.as_tensor(weights, dtype=torch.float32)
+
+    def state_dict(self):
+        """
+        Get the state of the buffer and of its priorities, to save it in a checkpoint.
+
+        Returns:
+            dict: The state of the uniform buffer with the priorities.
+        """
+        state_dict = super(PrioritizedReplayBuffer, self).state_dict()
+        state_dict["priorities"] = torch.from_numpy(self.tree.tree)
+        state_dict["max_priority"] = float(self.max_priority)
+        return state_dict
+
+    def load_state_dict(self, state_dict):
+        """
+        Restore the state of the buffer saved by state_dict.
+
+        A state saved by a uniform buffer gives every experience the same priority.
+
+        Args:
+            state_dict (dict): The state of the buffer.
+        """
+        super(PrioritizedReplayBuffer, self).load_state_dict(state_dict)
+        if "priorities" in state_dict:
+            self.tree.tree = state_dict["priorities"].numpy().copy()
+            self.max_priority = state_dict["max_priority"]
+        else:
+            self.tree = SumTree(self.capacity)
+            self.max_priority = 1.0
+            self.tree.update(np.arange(self.size), 1.0)
+
+    def update_priorities(self, indices, td_errors):
+        """
+        Update the priorities of sampled experiences from their TD errors.
+
+        Args:
+            indices (np.ndarray): The positions of the experiences in the buffer.
+            td_errors (torch.Tensor): The TD errors of the experiences.
+        """
+        priorities = np.abs(td_errors.detach().numpy()) + self.epsilon
+        self.max_priority = max(self.max_priority, priorities.max())
+        self.tree.update(indices, priorities**self.alpha)
+
+
+def update_target_dqn(target_dqn, dqn, tau=1.0):
+    """
+    Moves the weights of a target network towards the weights of the trained network.
+
+    With tau = 1 the weights are copied (hard update), with a smaller tau the
+    target network follows the trained one slowly (Polyak soft update).
+
+    Args:
+        target_dqn (torch.nn.Module): The target network to update.
+        dqn (torch.nn.Module): The trained network.
+        tau (float): The weight of the trained network in the update.
+    """
+    with torch.no_grad():
+        for target_parameter, parameter in zip(
+            target_dqn.parameters(), dqn.parameters()
+        ):
+            target_parameter.lerp_(parameter, tau)
+
+
+def train_dqn(dqn, replay_buffer, batch_size, gamma, optimizer, target_dqn=None):
     """
     Trains a DQN (Deep Q-Network) model using the given replay buffer, batch size, discount factor (gamma),
     and optimizer.
 
+    With a target network, the targets use double DQN: the trained network
+    selects the next action and the target network evaluates it. Only the
+    legal actions of the next state are considered. The game is zero-sum, so
+    the value of the next state is negated when the turn passed to the other
+    side, and kept during a sequence of jumps.
+
     Args:
         dqn (torch.nn.Module): The DQN model to train.
         replay_buffer (ReplayBuffer): The replay buffer containing the experiences.
         batch_size (int): The number of experiences to sample from the replay buffer for each training iteration.
         gamma (float): The discount factor for future rewards.
         optimizer (torch.optim.Optimizer): The optimizer used to update the DQN model's parameters.
+        target_dqn (torch.nn.Module, optional): The frozen target network. Defaults to the DQN itself.
 
     Returns:
         None
@@ -96,28 +418,52 @@ def train_dqn(dqn, replay_buffer, batch_size, gamma, optimizer):
     if len(replay_buffer) < batch_size:
         return
 
-    experiences = replay_buffer.sample(batch_size)
-    batch = Experience(*zip(*experiences))
+    if isinstance(replay_buffer, PrioritizedReplayBuffer):
+        batch, indices, weights = replay_buffer.sample(batch_size)
+    else:
+        batch = replay_buffer.sample(batch_size)
+        weights = torch.ones(batch_size)
 
-    # convert states, actions, rewards, and next_states to tensors
-    state_batch = torch.tensor(batch.state, dtype=torch.float32)
-    action_batch = torch.tensor(batch.action, dtype=torch.long)
-    reward_batch = torch.tensor(batch.reward, dtype=torch.float32)
-    next_state_batch = torch.tensor(batch.next_state, dtype=torch.float32)
+    state_batch = batch.state
+    action_batch = batch.action
+    reward_batch = batch.reward
+    next_state_batch = batch.next_state
+    done_batch = batch.done
+    next_mask_batch = batch.next_mask
+    # the next state is valued by the side to move, the opponent's value counts against the mover
+    sign_batch = 2 * batch.same_side - 1
 
     current_q_values = dqn(state_batch)  # get current Q-values
-    next_q_values = (
-        dqn(next_state_batch).max(dim=1).values.detach()
-    )  # get next Q-values and detach from computation graph
 
-    target_q_values = reward_batch + gamma * next_q_values  # calculate target Q-values
+    with torch.no_grad():  # next Q-values are not part of the computation graph
+        # illegal next actions can't be selected
+        next_q_values = dqn(next_state_batch).masked_fill(~next_mask_batch, -inf)
+        if target_dqn is None:
+            next_q_values = next_q_values.max(dim=1).values
+        else:
+            next_actions = next_q_values.argmax(dim=1, keepdim=True)
+            next_q_values = (
+                target_dqn(next_state_batch).gather(dim=1, index=next_actions).squeeze(1)
+            )
+
+        # states without legal actions have no future rewards
+        next_q_values = next_q_values.masked_fill(~next_mask_batch.any(dim=1), 0.0)
 
-    loss = nn.MSELoss()(
-        current_q_values.gather(
+    # calculate target Q-values, terminal states have no future rewards
+    target_q_values = (
+        reward_batch + gamma * (1 - done_batch) * sign_batch * next_q_values
+    )
+
+    td_errors = (
+        target_q_values
+        - current_q_values.gather(
             dim=1, index=action_batch.unsqueeze(dim=1)
-        ),  # gather Q-values for selected actions
-        target_q_values.unsqueeze(dim=1),
+        ).squeeze(dim=1)  # gather Q-values for selected actions
     )
+    loss = (weights * td_errors**2).mean()  # importance-sampling weighted MSE
+
+    if isinstance(replay_buffer, PrioritizedReplayBuffer):
+        replay_buffer.update_priorities(indices, td_errors)
 
     optimizer.zero_grad()  # zero the gradients
     loss.backward()  # backpropagate the loss
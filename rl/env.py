@@ -0,0 +1,217 @@
+import numpy as np
+
+from checkers.actions import JUMP, ActionSpace
+from checkers.board import Board
+from checkers.batch import boards_to_array, get_jumps_mask, get_moves_mask
+from checkers.encoding import encode_arrays, get_encoding_size
+from checkers.rules import PieceType, SideType
+from checkers.constants import (
+    MOVE_OFFSETS,
+    X_SIZE,
+    Y_SIZE,
+    CAPTURE_REWARD,
+    WIN_REWARD,
+)
+from rl.experience import Experience
+from typing import Optional
+
+
+class CheckersEnv:
+    """
+    Vectorized self-play environment running many games at once.
+
+    Both sides are played by the agent. Actions are encoded like
+    checkers.actions.ActionSpace, which indexes the flattened legal move masks
+    of checkers.batch. Rewards are given to the side that made the move.
+    """
+
+    def __init__(self, num_envs: int, x_size: int = X_SIZE, y_size: int = Y_SIZE):
+        """
+        Initializes a new instance of the CheckersEnv class.
+
+        Args:
+            num_envs (int): The number of games played in parallel.
+            x_size (int, optional): The size of the boards along the x-axis. Defaults to X_SIZE.
+            y_size (int, optional): The size of the boards along the y-axis. Defaults to Y_SIZE.
+        """
+        self.__num_envs = num_envs
+        self.__x_size = x_size
+        self.__y_size = y_size
+        self.__initial_board = boards_to_array([Board(x_size, y_size)])[0]
+        self.__action_space = ActionSpace(x_size, y_size)
+
+        self.__offsets_x = np.array([offset.x for offset in MOVE_OFFSETS])
+        self.__offsets_y = np.array([offset.y for offset in MOVE_OFFSETS])
+
+        self.__boards = np.empty((num_envs, y_size, x_size), dtype=np.int8)
+        self.__sides = np.empty(num_envs, dtype=np.int8)
+        self.__masks = np.empty((num_envs, self.action_size), dtype=bool)
+        self.last_experience: Optional[Experience] = None
+
+        self.reset()
+
+    @property
+    def num_envs(self) -> int:
+        """
+        Get the number of games played in parallel.
+
+        Returns:
+            int: The number of games.
+        """
+        return self.__num_envs
+
+    @property
+    def observation_size(self) -> int:
+        """
+        Get the size of the observation of one game.
+
+        Returns:
+            int: The number of planes times the number of cells of a board.
+        """
+        return get_encoding_size(self.__x_size, self.__y_size)
+
+    @property
+    def action_size(self) -> int:
+        """
+        Get the number of possible actions of one game.
+
+        Returns:
+            int: The number of move kinds times directions times cells.
+        """
+        return self.__action_space.size
+
+    @property
+    def boards(self) -> np.ndarray:
+        """
+        Get the boards of the games.
+
+        Returns:
+            np.ndarray: A copy of the N×H×W array of PieceType values.
+        """
+        return self.__boards.copy()
+
+    @property
+    def sides(self) -> np.ndarray:
+        """
+        Get the side to move in each game.
+
+        Returns:
+            np.ndarray: A copy of the array of N SideType values.
+        """
+        return self.__sides.copy()
+
+    def reset(
+        self, indices: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Start new games.
+
+        Args:
+            indices (np.ndarray, optional): The indices or boolean mask of the games to restart.
+                Defaults to all games.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The observations and the legal action masks of all games.
+        """
+        if indices is None:
+            indices = slice(None)
+
+        self.__boards[indices] = self.__initial_board
+        self.__sides[indices] = SideType.WHITE.value
+
+        boards = self.__boards[indices]
+        self.__masks[indices] = get_moves_mask(boards, self.__sides[indices]).reshape(
+            len(boards), -1
+        )
+
+        return self.__get_observations(), self.__masks.copy()
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Play one move in every game.
+
+        After a jump, the same side moves again if the piece can keep jumping,
+        and only those jumps are legal. A game is over when the side to move
+        has no legal moves; finished games must be restarted with reset.
+
+        Args:
+            actions (np.ndarray): The action of each game.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The observations,
+                rewards, done flags and legal action masks after the moves.
+
+        Raises:
+            ValueError: If an action is not legal in its game.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        games = np.arange(self.__num_envs)
+
+        if not (self.__masks[games, actions].all()):
+            raise ValueError("Illegal action in at least one game")
+
+        states = self.__get_observations()
+
+        kinds, directions, from_y, from_x = np.unravel_index(
+            actions, (2, len(MOVE_OFFSETS), self.__y_size, self.__x_size)
+        )
+        is_jump = kinds == JUMP
+        dx = self.__offsets_x[directions]
+        dy = self.__offsets_y[directions]
+        distance = kinds + 1
+        to_x = from_x + dx * distance
+        to_y = from_y + dy * distance
+
+        # change the position of the piece
+        self.__boards[games, to_y, to_x] = self.__boards[games, from_y, from_x]
+        self.__boards[games, from_y, from_x] = PieceType.NONE.value
+
+        # delete the killed pieces
+        self.__boards[
+            games[is_jump], (from_y + dy)[is_jump], (from_x + dx)[is_jump]
+        ] = PieceType.NONE.value
+
+        rewards = np.where(is_jump, CAPTURE_REWARD, 0.0).astype(np.float32)
+
+        # check if the jumping pieces can move again
+        sources = np.zeros_like(self.__boards, dtype=bool)
+        sources[games, to_y, to_x] = True
+        jumps_mask = get_jumps_mask(self.__boards, self.__sides, sources)
+        continuing = is_jump & jumps_mask.any(axis=(1, 2, 3))
+
+        self.__sides[~continuing] = np.where(
+            self.__sides[~continuing] == SideType.WHITE.value,
+            SideType.BLACK.value,
+            SideType.WHITE.value,
+        )
+
+        moves_mask = get_moves_mask(self.__boards, self.__sides)
+        moves_mask[continuing] = False
+        moves_mask[continuing, JUMP] = jumps_mask[continuing]
+        self.__masks[:] = moves_mask.reshape(self.__num_envs, -1)
+
+        # the side without valid moves loses
+        dones = ~self.__masks.any(axis=1)
+        rewards[dones] += WIN_REWARD
+
+        observations = self.__get_observations()
+        self.last_experience = Experience(
+            states,
+            actions,
+            rewards,
+            observations,
+            dones.astype(np.float32),
+            self.__masks.copy(),
+            continuing.astype(np.float32),
+        )
+
+        return observations, rewards, dones, self.__masks.copy()
+
+    def __get_observations(self) -> np.ndarray:
+        """Get the observations of all games.
+
+        Returns:
+            np.ndarray: An N×(PLANES_COUNT·H·W) array of the encoded positions,
+                like Game.get_flattened_state.
+        """
+        return encode_arrays(self.__boards, self.__sides)
@@ -1,5 +1,14 @@
 from collections import namedtuple
 
 Experience = namedtuple(
-    "Experience", field_names=["state", "action", "reward", "next_state"]
+    "Experience",
+    field_names=[
+        "state",
+        "action",
+        "reward",
+        "next_state",
+        "done",
+        "next_mask",
+        "same_side",
+    ],
 )
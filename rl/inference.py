@@ -0,0 +1,202 @@
+import copy
+import queue
+import threading
+import time
+import numpy as np
+import torch
+
+from checkers.constants import (
+    INFERENCE_MAX_BATCH_SIZE,
+    INFERENCE_MAX_WAIT,
+    INFERENCE_THREADS,
+)
+from concurrent.futures import Future
+from typing import Optional
+
+
+def quantize_dqn(dqn: torch.nn.Module) -> torch.nn.Module:
+    """
+    Get an int8 copy of a model for CPU inference.
+
+    The weights of the linear layers are quantized ahead of time and the
+    activations are quantized on the fly, so no calibration data is needed.
+    The original model is left unchanged.
+
+    Args:
+        dqn (torch.nn.Module): The model to quantize.
+
+    Returns:
+        torch.nn.Module: The quantized model, in evaluation mode.
+    """
+    return torch.ao.quantization.quantize_dynamic(
+        copy.deepcopy(dqn).eval(), {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def set_inference_threads(num_threads: int = INFERENCE_THREADS):
+    """
+    Set the number of threads torch uses for the operations of this process.
+
+    When many game processes share a host, one thread each avoids
+    oversubscribing the cores and keeps the latency of a move predictable.
+
+    Args:
+        num_threads (int, optional): The number of threads, 0 keeping the default of torch.
+            Defaults to INFERENCE_THREADS.
+    """
+    if num_threads > 0:
+        torch.set_num_threads(num_threads)
+
+
+class InferenceServer:
+    """
+    Batches the DQN evaluations requested by many concurrent games.
+
+    Callers submit single states and get a Future of their Q-values. A
+    background thread collects the pending states until the batch is full or
+    the oldest request has waited max_wait seconds, then evaluates them in a
+    single forward pass.
+    """
+
+    def __init__(
+        self,
+        dqn: torch.nn.Module,
+        max_batch_size: int = INFERENCE_MAX_BATCH_SIZE,
+        max_wait: float = INFERENCE_MAX_WAIT,
+    ):
+        """
+        Initializes a new instance of the InferenceServer class.
+
+        Args:
+            dqn (torch.nn.Module): The model giving the Q-values.
+            max_batch_size (int, optional): The maximum number of states of a forward pass.
+                Defaults to INFERENCE_MAX_BATCH_SIZE.
+            max_wait (float, optional): The maximum time in seconds a request waits for
+                other ones before its batch is evaluated. Defaults to INFERENCE_MAX_WAIT.
+        """
+        self.__dqn = dqn
+        self.__max_batch_size = max_batch_size
+        self.__max_wait = max_wait
+
+        self.__requests = queue.Queue()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the server accepts requests.
+
+        Returns:
+            bool: True if the server was started and not stopped, False otherwise.
+        """
+        return self.__thread is not None
+
+    def start(self):
+        """Start the thread evaluating the requests."""
+        if self.is_running:
+            return
+
+        self.__thread = threading.Thread(target=self.__serve, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Evaluate the pending requests, then stop the thread."""
+        if not (self.is_running):
+            return
+
+        # the sentinel is queued after the pending requests, so they are served first
+        self.__requests.put(None)
+        self.__thread.join()
+        self.__thread = None
+
+    def submit(self, state) -> Future:
+        """Request the Q-values of a state.
+
+        Args:
+            state (array_like): The encoded state, e.g. from checkers.encoding.encode_board.
+
+        Returns:
+            Future: Resolves to the np.ndarray of the Q-values of every action.
+
+        Raises:
+            RuntimeError: If the server is not running.
+        """
+        if not (self.is_running):
+            raise RuntimeError("The inference server is not running")
+
+        future = Future()
+        # the wait of a request starts when it is submitted, not when the server takes it
+        self.__requests.put(
+            (np.asarray(state, dtype=np.float32), future, time.monotonic())
+        )
+        return future
+
+    def predict(self, state) -> np.ndarray:
+        """Get the Q-values of a state, waiting for its batch to be evaluated.
+
+        Args:
+            state (array_like): The encoded state.
+
+        Returns:
+            np.ndarray: The Q-values of every action.
+        """
+        return self.submit(state).result()
+
+    def __enter__(self) -> "InferenceServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __serve(self):
+        """Collect and evaluate batches of requests until the sentinel is received."""
+        stopping = False
+        while not (stopping):
+            request = self.__requests.get()
+            if request is None:
+                break
+
+            batch = [request]
+            deadline = request[2] + self.__max_wait
+            while len(batch) < self.__max_batch_size:
+                # past the deadline, only the requests already queued join the batch
+                timeout = max(deadline - time.monotonic(), 0.0)
+                try:
+                    request = self.__requests.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            self.__evaluate(batch)
+
+    def __evaluate(self, batch: list[tuple[np.ndarray, Future, float]]):
+        """Evaluate a batch of requests in one forward pass and resolve their futures.
+
+        Args:
+            batch (list[tuple[np.ndarray, Future, float]]): The states, futures and submission
+                times of the requests.
+        """
+        # skip the requests cancelled while waiting
+        batch = [
+            (state, future)
+            for state, future, _ in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not (batch):
+            return
+
+        try:
+            states = torch.as_tensor(np.stack([state for state, _ in batch]))
+            with torch.no_grad():
+                q_values = self.__dqn(states).numpy()
+        except Exception as exception:
+            for _, future in batch:
+                future.set_exception(exception)
+            return
+
+        for (_, future), row in zip(batch, q_values):
+            future.set_result(row)
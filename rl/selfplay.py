@@ -0,0 +1,250 @@
+import copy
+import logging
+import queue
+import time
+import numpy as np
+import torch
+import torch.optim as optim
+import torch.multiprocessing as mp
+
+from checkers.constants import (
+    LEARNING_RATE,
+    BATCH_SIZE,
+    GAMMA,
+    EPSILON,
+    REPLAY_BUFFER_SIZE,
+    SELF_PLAY_WORKERS,
+    SELF_PLAY_ENVS,
+    SELF_PLAY_QUEUE_SIZE,
+    SELF_PLAY_QUEUE_TIMEOUT,
+    WEIGHTS_SYNC_INTERVAL,
+    TARGET_UPDATE_INTERVAL,
+    TARGET_UPDATE_TAU,
+)
+from rl.dqn import DQN, ReplayBuffer, select_actions, train_dqn, update_target_dqn
+from rl.env import CheckersEnv
+from typing import Optional
+
+
+class SharedWeights:
+    """
+    DQN weights shared between the learner and the self-play workers.
+
+    The weights live in shared memory, so publishing them only copies the
+    tensors in place and bumps a version counter instead of pickling them.
+    """
+
+    def __init__(self, dqn: DQN, context=mp):
+        """
+        Initializes the shared weights with a copy of the given model.
+
+        Args:
+            dqn (DQN): The model whose weights are shared.
+            context (optional): The multiprocessing context. Defaults to torch.multiprocessing.
+        """
+        self.__dqn = copy.deepcopy(dqn)
+        self.__dqn.share_memory()
+        self.__version = context.Value("i", 0)
+
+    def publish(self, dqn: DQN):
+        """
+        Copy the weights of the model to the shared memory.
+
+        Args:
+            dqn (DQN): The model of the learner.
+        """
+        with self.__version.get_lock(), torch.no_grad():
+            for shared_parameter, parameter in zip(
+                self.__dqn.parameters(), dqn.parameters()
+            ):
+                shared_parameter.copy_(parameter)
+            self.__version.value += 1
+
+    def sync(self, dqn: DQN, version: int) -> int:
+        """
+        Copy the shared weights to the model if they were published since the given version.
+
+        Args:
+            dqn (DQN): The model of the worker.
+            version (int): The version the model currently has.
+
+        Returns:
+            int: The version the model has after the call.
+        """
+        if self.__version.value == version:
+            return version
+
+        with self.__version.get_lock(), torch.no_grad():
+            for parameter, shared_parameter in zip(
+                dqn.parameters(), self.__dqn.parameters()
+            ):
+                parameter.copy_(shared_parameter)
+            return self.__version.value
+
+
+def self_play_worker(
+    shared_weights: SharedWeights,
+    experience_queue,
+    stop_event,
+    num_envs: int = SELF_PLAY_ENVS,
+    epsilon: float = EPSILON,
+    seed: int = 0,
+):
+    """
+    Play games against itself and send the transitions to the learner.
+
+    Args:
+        shared_weights (SharedWeights): The weights published by the learner.
+        experience_queue (Queue): The queue to send the batched transitions of each step to.
+        stop_event (Event): Set by the learner when the worker must stop.
+        num_envs (int, optional): The number of games played in parallel. Defaults to SELF_PLAY_ENVS.
+        epsilon (float, optional): The exploration rate. Defaults to EPSILON.
+        seed (int, optional): The seed of the random generator. Defaults to 0.
+    """
+    # the workers share the cores, so each one runs single-threaded
+    torch.set_num_threads(1)
+    generator = np.random.default_rng(seed)
+
+    env = CheckersEnv(num_envs)
+    dqn = DQN(env.observation_size, env.action_size)
+    version = -1
+
+    observations, masks = env.reset()
+    while not (stop_event.is_set()):
+        version = shared_weights.sync(dqn, version)
+
+        actions = select_actions(dqn, observations, masks, epsilon, generator)
+        observations, _, dones, masks = env.step(actions)
+
+        while not (stop_event.is_set()):
+            try:
+                experience_queue.put(env.last_experience, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+        if dones.any():
+            observations, masks = env.reset(dones)
+
+    # don't wait for the learner to read the remaining transitions
+    experience_queue.cancel_join_thread()
+
+
+def wait_for_experience(experience_queue, workers: list):
+    """
+    Wait for the next transitions of the workers.
+
+    The workers only stop when the learner asks them to, so the learner
+    raises instead of waiting forever if one of them exited.
+
+    Args:
+        experience_queue (Queue): The queue the workers send their transitions to.
+        workers (list[Process]): The worker processes.
+
+    Returns:
+        Experience: The batched transitions of a step of a worker.
+
+    Raises:
+        RuntimeError: If a worker exited.
+    """
+    while True:
+        try:
+            return experience_queue.get(timeout=SELF_PLAY_QUEUE_TIMEOUT)
+        except queue.Empty:
+            exit_codes = [worker.exitcode for worker in workers]
+            if any(exit_code is not None for exit_code in exit_codes):
+                raise RuntimeError(f"Self-play worker exited, exit codes {exit_codes}")
+
+
+def run_self_play(
+    num_steps: int,
+    num_workers: int = SELF_PLAY_WORKERS,
+    num_envs: int = SELF_PLAY_ENVS,
+    dqn: Optional[DQN] = None,
+    replay_buffer: Optional[ReplayBuffer] = None,
+) -> DQN:
+    """
+    Train a DQN on games generated by self-play worker processes.
+
+    The learner owns the replay buffer and the optimizer. It adds the
+    transitions received from the workers to the buffer, trains on it and
+    periodically publishes the new weights to the workers.
+
+    Args:
+        num_steps (int): The number of training steps of the learner.
+        num_workers (int, optional): The number of worker processes. Defaults to SELF_PLAY_WORKERS.
+        num_envs (int, optional): The number of games per worker. Defaults to SELF_PLAY_ENVS.
+        dqn (DQN, optional): The model to train. Defaults to a new model.
+        replay_buffer (ReplayBuffer, optional): The replay buffer of the learner, which may be a
+            PrioritizedReplayBuffer. Defaults to a new uniform buffer.
+
+    Returns:
+        DQN: The trained model.
+    """
+    context = mp.get_context("spawn")
+
+    env = CheckersEnv(1)
+    if dqn is None:
+        dqn = DQN(env.observation_size, env.action_size)
+    target_dqn = copy.deepcopy(dqn)
+    optimizer = optim.Adam(dqn.parameters(), lr=LEARNING_RATE)
+    if replay_buffer is None:
+        replay_buffer = ReplayBuffer(REPLAY_BUFFER_SIZE)
+
+    shared_weights = SharedWeights(dqn, context)
+    experience_queue = context.Queue(maxsize=SELF_PLAY_QUEUE_SIZE)
+    stop_event = context.Event()
+
+    workers = [
+        context.Process(
+            target=self_play_worker,
+            args=(shared_weights, experience_queue, stop_event, num_envs, EPSILON, seed),
+            daemon=True,
+        )
+        for seed in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    start_time = time.perf_counter()
+    transitions_count = 0
+
+    try:
+        for step in range(num_steps):
+            # wait for new transitions, then take all that are ready
+            experiences = [wait_for_experience(experience_queue, workers)]
+            while True:
+                try:
+                    experiences.append(experience_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for experience in experiences:
+                replay_buffer.push_batch(experience)
+                transitions_count += len(experience.action)
+
+            train_dqn(dqn, replay_buffer, BATCH_SIZE, GAMMA, optimizer, target_dqn)
+
+            if (step + 1) % TARGET_UPDATE_INTERVAL == 0:
+                update_target_dqn(target_dqn, dqn, TARGET_UPDATE_TAU)
+
+            if (step + 1) % WEIGHTS_SYNC_INTERVAL == 0:
+                shared_weights.publish(dqn)
+                elapsed = time.perf_counter() - start_time
+                logging.info(
+                    f"Self-play step {step + 1} | "
+                    f"{transitions_count / elapsed:.0f} transitions/s"
+                )
+    finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    return dqn
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_self_play(num_steps=1000)